@@ -77,7 +77,10 @@ def initialize_services():
         order_service = OrderService(db_connector, region_name)
         inventory_service = InventoryService(db_connector)
         payment_service = PaymentService(db_connector)
-        analytics_service = AnalyticsService(db_connector)
+        analytics_service = AnalyticsService(
+            db_connector,
+            use_summary_table=os.environ.get("DASHBOARD_SUMMARY_TABLE", "false").lower() == "true",
+        )
 
         print("✅ All services initialized successfully")
         print("=" * 50)
@@ -510,6 +513,9 @@ def api_new_order():
             items=data["items"],
         )
 
+        if result.get("success"):
+            analytics_service.invalidate_cache()
+
         execution_time = (time.time() - start_time) * 1000
         logger.info(f"   ✅ New Order Transaction completed in {execution_time:.2f}ms")
         logger.info(f"   Result: {result}")
@@ -556,6 +562,9 @@ def api_payment():
             amount=data["amount"],
         )
 
+        if result.get("success"):
+            analytics_service.invalidate_cache()
+
         execution_time = (time.time() - start_time) * 1000
         logger.info(f"   ✅ Payment Transaction completed in {execution_time:.2f}ms")
         logger.info(f"   Result: {result}")
@@ -703,13 +712,13 @@ def api_test_acid(test_type: str):
         logger.info(f"✅ ACID tests initialized for {acid_tests.provider_name}")
 
         if test_type == "atomicity":
-            result = acid_tests.test_atomicity()
+            result = acid_tests.test_atomicity().to_dict()
         elif test_type == "consistency":
-            result = acid_tests.test_consistency()
+            result = acid_tests.test_consistency().to_dict()
         elif test_type == "isolation":
-            result = acid_tests.test_isolation()
+            result = acid_tests.test_isolation().to_dict()
         elif test_type == "durability":
-            result = acid_tests.test_durability()
+            result = acid_tests.test_durability().to_dict()
         elif test_type == "all":
             result = acid_tests.run_all_tests()
         else:
@@ -757,6 +766,9 @@ def api_test_multi_region_create_order():
             items=data["items"],
         )
 
+        if result.get("success"):
+            analytics_service.invalidate_cache()
+
         execution_time = (time.time() - start_time) * 1000
         logger.info(
             f"   ✅ Multi-Region New Order Transaction completed in {execution_time:.2f}ms"
@@ -986,6 +998,9 @@ def api_test_payment():
             amount=10.0
         )
         
+        if test_result.get("success"):
+            analytics_service.invalidate_cache()
+
         logger.info(f"   Payment test result: {test_result}")
         
         return jsonify({
@@ -3,6 +3,7 @@ Simplified base database connector for UX study
 Only includes essential methods that participants need to implement
 """
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
@@ -23,6 +24,7 @@ class BaseDatabaseConnector(ABC):
     def __init__(self):
         self.connection = None
         self.provider_name = "Unknown"
+        self._prepared_statements: Dict[str, str] = {}
 
     @abstractmethod
     def test_connection(self) -> bool:
@@ -33,9 +35,53 @@ class BaseDatabaseConnector(ABC):
     def execute_query(
         self, query: str, params: Optional[tuple] = None
     ) -> List[Dict[str, Any]]:
-        """Execute a query and return results as list of dictionaries"""
+        """Execute a query and return results as list of dictionaries
+
+        Callers bound result size in the SQL (LIMIT) and pass parameters as
+        native Python types so they can be typed server-side. Implementations
+        should read only the rows the statement returns - no client-side
+        slicing of a larger fetch and no second round-trip.
+        """
         pass
 
+    def execute_scalar(self, query: str, params: Optional[Any] = None) -> Any:
+        """Execute a query and return the first column of its first row
+
+        Returns None when the query yields no rows or fails.
+        """
+        rows = self.execute_query(query, params)
+        return next(iter(rows[0].values()), None) if rows else None
+
+    def prepare(self, name: str, query: str):
+        """Register a named statement for repeated execution
+
+        Connectors whose driver exposes server-side prepared statements can
+        override this to prepare once per connection.
+        """
+        self._prepared_statements[name] = query
+
+    def execute_prepared(
+        self, name: str, params: Optional[Any] = None
+    ) -> List[Dict[str, Any]]:
+        """Execute a statement previously registered with prepare()"""
+        return self.execute_query(self._prepared_statements[name], params)
+
+    async def execute_query_async(
+        self, query: str, params: Optional[tuple] = None
+    ) -> List[Dict[str, Any]]:
+        """Execute a query without blocking the event loop
+
+        Runs the synchronous execute_query in a worker thread; connectors with
+        a native async driver can override this.
+        """
+        return await asyncio.to_thread(self.execute_query, query, params)
+
+    async def execute_prepared_async(
+        self, name: str, params: Optional[Any] = None
+    ) -> List[Dict[str, Any]]:
+        """Async counterpart of execute_prepared"""
+        return await asyncio.to_thread(self.execute_prepared, name, params)
+
     def get_provider_name(self) -> str:
         """Get the database provider name"""
         return self.provider_name
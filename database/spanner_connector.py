@@ -5,15 +5,120 @@ Fully functional connector for Google Cloud Spanner
 
 import logging
 import os
-from typing import Any, Dict, List, Optional, Union, Tuple
+import re
+from typing import Any, Callable, Dict, List, Optional, Union, Tuple
 from datetime import datetime
 
 from google.cloud import spanner
-from google.cloud.spanner_v1 import Client
+from google.cloud.spanner_v1 import Client, TypeCode
+from google.cloud.spanner_v1.pool import FixedSizePool
 from .base_connector import BaseDatabaseConnector
 
 logger = logging.getLogger(__name__)
 
+# Spanner column types that are serialized to ISO-8601 strings
+_TEMPORAL_TYPE_CODES = (TypeCode.TIMESTAMP, TypeCode.DATE)
+
+
+def _identity(value):
+    """Pass a cell value through unchanged"""
+    return value
+
+
+def _to_isoformat(value):
+    """Serialize a TIMESTAMP/DATE cell, keeping NULLs as None"""
+    return value.isoformat() if value is not None else None
+
+
+def _to_json_value(value):
+    """Serialize a cell whose column type is unknown"""
+    return value.isoformat() if hasattr(value, 'isoformat') else value
+
+
+# Indexes backing the dashboard queries; INCLUDE keeps the scans index-only.
+# order_table and stock get none: an o_entry_d-led index would hotspot on its
+# ever-increasing key, and s_quantity is rewritten by every new order
+DASHBOARD_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS order_line_order_idx "
+    "ON order_line (ol_w_id, ol_d_id, ol_o_id) INCLUDE (ol_amount)",
+)
+
+# One-off catch-up for district order counters: orders written by the old
+# MAX(o_id)+1 path never advanced d_next_o_id, and some rows start out NULL
+_RECONCILE_DISTRICT_ORDER_IDS_DML = """
+    UPDATE district
+    SET d_next_o_id = GREATEST(
+        COALESCE(d_next_o_id, 1),
+        (SELECT COALESCE(MAX(o.o_id), 0) + 1 FROM order_table o
+         WHERE o.o_w_id = district.d_w_id AND o.o_d_id = district.d_id)
+    )
+    WHERE true
+"""
+
+
+def _scalar_param_type(value):
+    """Spanner type for a scalar @name parameter value"""
+    if value is None:
+        return spanner.param_types.STRING
+    if isinstance(value, bool):
+        return spanner.param_types.BOOL
+    if isinstance(value, int):
+        return spanner.param_types.INT64
+    if isinstance(value, float):
+        return spanner.param_types.FLOAT64
+    if isinstance(value, datetime):
+        return spanner.param_types.TIMESTAMP
+    return spanner.param_types.STRING
+
+
+def _infer_param_type(value):
+    """Spanner type for an @name parameter; lists bind as arrays for = ANY(...)"""
+    if isinstance(value, (list, tuple)):
+        element = next((item for item in value if item is not None), None)
+        return spanner.param_types.Array(_scalar_param_type(element))
+    return _scalar_param_type(value)
+
+
+# Query-text parsing used when Spanner returns no fields metadata
+_SELECT_LIST_RE = re.compile(r'SELECT\s+(.*?)\s+FROM\s', re.IGNORECASE | re.DOTALL)
+_ALIAS_RE = re.compile(r'\bAS\s+([A-Za-z_]\w*)\s*$', re.IGNORECASE)
+_COUNT_STAR_RE = re.compile(r'COUNT\(\*\)', re.IGNORECASE)
+
+
+def _split_select_list(select_list: str) -> List[str]:
+    """Split a SELECT list on commas that are not inside parentheses"""
+    parts = []
+    depth = 0
+    start = 0
+    for i, char in enumerate(select_list):
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            parts.append(select_list[start:i])
+            start = i + 1
+    parts.append(select_list[start:])
+    return [part.strip() for part in parts]
+
+
+def _guess_column_names(query: str) -> List[str]:
+    """Extract result column names from the SELECT list of a query"""
+    match = _SELECT_LIST_RE.search(query)
+    if not match:
+        return []
+    
+    column_names = []
+    for col in _split_select_list(match.group(1)):
+        # Handle "column AS alias" syntax
+        alias = _ALIAS_RE.search(col)
+        if alias:
+            column_names.append(alias.group(1))
+        else:
+            # Remove table prefixes like "table.column"
+            column_names.append(col.rsplit('.', 1)[-1].strip())
+    return column_names
+
 
 class SpannerConnector(BaseDatabaseConnector):
     """
@@ -32,6 +137,13 @@ class SpannerConnector(BaseDatabaseConnector):
         self.database_id = os.getenv("SPANNER_DATABASE_ID")
         self.credentials_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
         
+        # Session pool sizing - sessions are created once at startup and
+        # reused (LIFO) by every snapshot/transaction afterwards. The timeout
+        # is how long a request waits for a free session before failing, so a
+        # saturated pool errors fast instead of queueing dashboards forever
+        self.pool_size = int(os.getenv("SPANNER_POOL_SIZE", "10"))
+        self.pool_timeout = int(os.getenv("SPANNER_POOL_TIMEOUT", "5"))
+        
         if self.credentials_path:
             print(f"   Credentials: ✅ {self.credentials_path}")
         else:
@@ -41,6 +153,10 @@ class SpannerConnector(BaseDatabaseConnector):
         self.client = None
         self.instance = None
         self.database = None
+        self.pool = None
+        
+        # SQL text -> (column names, cell converters) for execute_query
+        self._column_cache: Dict[str, Tuple[Tuple[str, ...], Tuple[Any, ...]]] = {}
         
         try:
             self._initialize_spanner_client()
@@ -58,9 +174,11 @@ class SpannerConnector(BaseDatabaseConnector):
             self.client = spanner.Client(project=self.project_id)
             print(f"✅ Spanner client created for project: {self.project_id}")
             
-            # Get instance and database
+            # Get instance and database with a pre-warmed session pool so the
+            # first requests don't pay for on-demand session creation
             self.instance = self.client.instance(self.instance_id)
-            self.database = self.instance.database(self.database_id)
+            self.pool = FixedSizePool(size=self.pool_size, default_timeout=self.pool_timeout)
+            self.database = self.instance.database(self.database_id, pool=self.pool)
             print(f"✅ Connected to instance: {self.instance_id}")
             print(f"✅ Connected to database: {self.database_id}")
             
@@ -129,6 +247,45 @@ class SpannerConnector(BaseDatabaseConnector):
             logger.error(f"❌ DDL execution failed: {str(e)}")
             return False
 
+    def create_dashboard_indexes(self) -> bool:
+        """
+        Create the indexes in DASHBOARD_INDEXES in a single schema update
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            if not self.database:
+                logger.error("❌ No database connection available for DDL operations")
+                return False
+
+            logger.info(f"🔧 Creating {len(DASHBOARD_INDEXES)} dashboard indexes...")
+            # One update_ddl call so Spanner backfills them as one operation
+            operation = self.database.update_ddl(list(DASHBOARD_INDEXES))
+            operation.result()
+
+            logger.info("✅ Dashboard indexes created")
+            return True
+
+        except Exception as e:
+            logger.error(f"❌ Dashboard index creation failed: {str(e)}")
+            return False
+
+    def reconcile_district_order_ids(self) -> bool:
+        """
+        Bring every district's d_next_o_id past the highest existing order ID.
+        Run once before new orders claim IDs from the counter.
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        logger.info("🔧 Reconciling district order ID counters...")
+        if not self.execute_dml(_RECONCILE_DISTRICT_ORDER_IDS_DML):
+            return False
+
+        logger.info("✅ District order ID counters reconciled")
+        return True
+
     def execute_query(
         self, query: str, params: Optional[Union[tuple, Dict[str, Any]]] = None
     ) -> List[Dict[str, Any]]:
@@ -139,46 +296,7 @@ class SpannerConnector(BaseDatabaseConnector):
                 print("❌ No database connection available")
                 return []
             
-            # Handle different parameter formats
-            spanner_params = {}
-            spanner_param_types = {}
-            
-            if params:
-                if isinstance(params, dict):
-                    # Handle @paramName format - convert to Spanner's $1, $2, $3... format
-                    converted_query = query
-                    param_values = []
-                    
-                    # Extract parameter values in order
-                    for key, value in params.items():
-                        param_values.append(value)
-                        # Replace @paramName with $1, $2, $3...
-                        converted_query = converted_query.replace(f"@{key}", f"${len(param_values)}")
-                    
-                    # Build Spanner parameters and types
-                    for i, value in enumerate(param_values, 1):
-                        spanner_params[f"p{i}"] = value
-                        # Set explicit parameter types for Spanner
-                        if value is None:
-                            spanner_param_types[f"p{i}"] = spanner.param_types.STRING
-                        elif isinstance(value, bool):
-                            spanner_param_types[f"p{i}"] = spanner.param_types.BOOL
-                        elif isinstance(value, int):
-                            spanner_param_types[f"p{i}"] = spanner.param_types.INT64
-                        elif isinstance(value, float):
-                            spanner_param_types[f"p{i}"] = spanner.param_types.FLOAT64
-                        elif isinstance(value, str):
-                            spanner_param_types[f"p{i}"] = spanner.param_types.STRING
-                        elif isinstance(value, datetime):
-                            spanner_param_types[f"p{i}"] = spanner.param_types.TIMESTAMP
-                        else:
-                            spanner_param_types[f"p{i}"] = spanner.param_types.STRING
-                    
-                    query = converted_query
-                    
-                elif isinstance(params, (tuple, list)):
-                    # Handle tuple/list format (convert to @paramName format)
-                    spanner_params, spanner_param_types = self._convert_query_to_spanner_format(query, params)
+            query, spanner_params, spanner_param_types = self._bind_params(query, params)
             
             # Execute the query with a fresh snapshot
             with self.database.snapshot() as snapshot:
@@ -192,52 +310,7 @@ class SpannerConnector(BaseDatabaseConnector):
                 rows_data = list(results_iter)
                 print(f"   ✅ Query executed successfully, returned {len(rows_data)} rows")
                 
-                # Column names - use Spanner's fields metadata when available
-                if hasattr(results_iter, 'fields') and results_iter.fields:
-                    column_names = [field.name for field in results_iter.fields]
-                else:
-                    # Fallback: try to extract column names from the query
-                    query_upper = query.upper()
-                    if 'SELECT' in query_upper:
-                        select_start = query_upper.find('SELECT') + 6
-                        from_start = query_upper.find('FROM')
-                        if from_start > select_start:
-                            select_clause = query[select_start:from_start].strip()
-                            # Split by comma and extract column names
-                            for col in select_clause.split(','):
-                                col = col.strip()
-                                # Handle "column AS alias" syntax
-                                if ' AS ' in col.upper():
-                                    col = col.split(' AS ')[1].strip()
-                                # Remove table prefixes like "table.column"
-                                if '.' in col:
-                                    col = col.split('.')[-1].strip()
-                                column_names.append(col)
-                
-                # If we still don't have column names, use generic ones
-                if not column_names:
-                    # For COUNT(*) queries, use 'count' as the column name
-                    if 'COUNT(*)' in query.upper():
-                        column_names = ['count']
-                    else:
-                        # Use the first row to determine column count
-                        column_names = [f"col_{i}" for i in range(len(rows_data[0]) if rows_data else 0)]
-                
-                # Build dict rows
-                rows = []
-                for row in rows_data:
-                    row_dict = {}
-                    for i, value in enumerate(row):
-                        col_name = column_names[i] if i < len(column_names) else f"col_{i}"
-                        if hasattr(value, 'isoformat'):  # datetime
-                            row_dict[col_name] = value.isoformat()
-                        elif value is None:
-                            row_dict[col_name] = None
-                        else:
-                            row_dict[col_name] = value
-                    rows.append(row_dict)
-                
-                return rows
+                return self._rows_to_dicts(query, results_iter, rows_data)
                 
         except Exception as e:
             logger.error(f"Query execution failed: {str(e)}")
@@ -246,6 +319,117 @@ class SpannerConnector(BaseDatabaseConnector):
             print(f"   Error type: {type(e).__name__}")
             return []
 
+    def execute_scalar(
+        self, query: str, params: Optional[Union[tuple, Dict[str, Any]]] = None
+    ) -> Any:
+        """Execute a query and return the first column of its first row
+
+        Skips the column lookup and dict building of execute_query. Returns
+        None when the query yields no rows or fails.
+        """
+        try:
+            if not self.database:
+                logger.error("No database connection available")
+                return None
+            
+            query, spanner_params, spanner_param_types = self._bind_params(query, params)
+            with self.database.snapshot() as snapshot:
+                if spanner_params:
+                    results_iter = snapshot.execute_sql(query, params=spanner_params, param_types=spanner_param_types)
+                else:
+                    results_iter = snapshot.execute_sql(query)
+                row = next(iter(results_iter), None)
+            return _to_json_value(row[0]) if row else None
+                
+        except Exception as e:
+            logger.error(f"Scalar query execution failed: {str(e)}")
+            return None
+
+    def _bind_params(
+        self, query: str, params: Optional[Union[tuple, Dict[str, Any]]]
+    ) -> Tuple[str, Dict[str, Any], Dict[str, Any]]:
+        """Rewrite placeholders to $n and build typed Spanner parameters"""
+        # Handle different parameter formats
+        spanner_params = {}
+        spanner_param_types = {}
+        
+        if params:
+            if isinstance(params, dict):
+                # Handle @paramName format - convert to Spanner's $1, $2, $3... format
+                converted_query = query
+                param_values = []
+                
+                # Extract parameter values in order
+                for key, value in params.items():
+                    param_values.append(value)
+                    # Replace @paramName with $1, $2, $3...
+                    converted_query = converted_query.replace(f"@{key}", f"${len(param_values)}")
+                
+                # Build Spanner parameters and types
+                for i, value in enumerate(param_values, 1):
+                    spanner_params[f"p{i}"] = value
+                    # Set explicit parameter types for Spanner
+                    spanner_param_types[f"p{i}"] = _infer_param_type(value)
+                
+                query = converted_query
+                
+            elif isinstance(params, (tuple, list)):
+                # Handle tuple/list format (convert to @paramName format)
+                spanner_params, spanner_param_types = self._convert_query_to_spanner_format(query, params)
+        return query, spanner_params, spanner_param_types
+
+    def _rows_to_dicts(
+        self, query: str, results_iter, rows_data: List[Any]
+    ) -> List[Dict[str, Any]]:
+        """Turn raw result rows into dicts keyed by column name"""
+        # Column names and per-column converters are memoized per SQL
+        # text, so repeated queries skip metadata inspection entirely
+        columns = self._column_cache.get(query)
+        if columns is None:
+            columns = self._resolve_columns(query, results_iter)
+            if columns[0]:
+                self._column_cache[query] = columns
+        column_names, converters = columns
+        
+        # Pad names/converters to the row width; columns without a
+        # known name or type fall back to generic ones
+        row_width = len(rows_data[0]) if rows_data else 0
+        if row_width > len(column_names):
+            column_names = column_names + tuple(f"col_{i}" for i in range(len(column_names), row_width))
+        if len(column_names) > len(converters):
+            converters = converters + (_to_json_value,) * (len(column_names) - len(converters))
+        
+        # Build dict rows
+        rows = [
+            {name: convert(value) for name, convert, value in zip(column_names, converters, row)}
+            for row in rows_data
+        ]
+        
+        return rows
+
+    def _resolve_columns(
+        self, query: str, results_iter
+    ) -> Tuple[Tuple[str, ...], Tuple[Any, ...]]:
+        """Resolve result column names and cell converters for a query"""
+        # Use Spanner's fields metadata when available so cell types are
+        # resolved once per query instead of once per value
+        if hasattr(results_iter, 'fields') and results_iter.fields:
+            column_names = tuple(field.name for field in results_iter.fields)
+            converters = tuple(
+                _to_isoformat if field.type_.code in _TEMPORAL_TYPE_CODES else _identity
+                for field in results_iter.fields
+            )
+            return column_names, converters
+        
+        # Fallback: try to extract column names from the query
+        column_names = _guess_column_names(query)
+        
+        # For COUNT(*) queries, use 'count' as the column name
+        if not column_names and _COUNT_STAR_RE.search(query):
+            column_names = ['count']
+        
+        return tuple(column_names), ()
+
     def execute_dml(
         self, query: str, params: Optional[Union[tuple, Dict[str, Any]]] = None
     ) -> bool:
@@ -256,46 +440,7 @@ class SpannerConnector(BaseDatabaseConnector):
                 print("❌ No database connection available")
                 return False
             
-            # Handle different parameter formats
-            spanner_params = {}
-            spanner_param_types = {}
-            
-            if params:
-                if isinstance(params, dict):
-                    # Handle @paramName format - convert to Spanner's $1, $2, $3... format
-                    converted_query = query
-                    param_values = []
-                    
-                    # Extract parameter values in order
-                    for key, value in params.items():
-                        param_values.append(value)
-                        # Replace @paramName with $1, $2, $3...
-                        converted_query = converted_query.replace(f"@{key}", f"${len(param_values)}")
-                    
-                    # Build Spanner parameters and types
-                    for i, value in enumerate(param_values, 1):
-                        spanner_params[f"p{i}"] = value
-                        # Set explicit parameter types for Spanner
-                        if value is None:
-                            spanner_param_types[f"p{i}"] = spanner.param_types.STRING
-                        elif isinstance(value, bool):
-                            spanner_param_types[f"p{i}"] = spanner.param_types.BOOL
-                        elif isinstance(value, int):
-                            spanner_param_types[f"p{i}"] = spanner.param_types.INT64
-                        elif isinstance(value, float):
-                            spanner_param_types[f"p{i}"] = spanner.param_types.FLOAT64
-                        elif isinstance(value, str):
-                            spanner_param_types[f"p{i}"] = spanner.param_types.STRING
-                        elif isinstance(value, datetime):
-                            spanner_param_types[f"p{i}"] = spanner.param_types.TIMESTAMP
-                        else:
-                            spanner_param_types[f"p{i}"] = spanner.param_types.STRING
-                    
-                    query = converted_query
-                    
-                elif isinstance(params, (tuple, list)):
-                    # Handle tuple/list format (convert to @paramName format)
-                    spanner_params, spanner_param_types = self._convert_query_to_spanner_format(query, params)
+            query, spanner_params, spanner_param_types = self._bind_params(query, params)
             
             # Execute the DML statement with a read-write transaction
             print(f"🔧 Executing DML: {query[:100]}...")
@@ -320,6 +465,125 @@ class SpannerConnector(BaseDatabaseConnector):
             print(f"   Error type: {type(e).__name__}")
             return False
 
+    def execute_batch_dml(
+        self, statements: List[Tuple[str, Optional[Union[tuple, Dict[str, Any]]]]]
+    ) -> bool:
+        """
+        Execute several DML statements in one read-write transaction
+
+        Args:
+            statements: (query, params) pairs, run in order with batch_update
+
+        Returns:
+            bool: True if every statement succeeded, False otherwise
+        """
+        try:
+            if not self.database:
+                logger.error("No database connection available")
+                return False
+            
+            batch = self._bind_batch(statements)
+            
+            def execute_batch_in_transaction(transaction):
+                self._run_batch_update(transaction, batch)
+            
+            self.database.run_in_transaction(execute_batch_in_transaction)
+            return True
+                
+        except Exception as e:
+            logger.error(f"Batch DML execution failed: {str(e)}")
+            return False
+
+    def _bind_batch(
+        self, statements: List[Tuple[str, Optional[Union[tuple, Dict[str, Any]]]]]
+    ) -> List[Any]:
+        """Bind (query, params) pairs into the statement format batch_update takes"""
+        batch = []
+        for query, params in statements:
+            query, spanner_params, spanner_param_types = self._bind_params(query, params)
+            batch.append((query, spanner_params, spanner_param_types) if spanner_params else query)
+        return batch
+
+    @staticmethod
+    def _run_batch_update(transaction, batch: List[Any]):
+        """Run a bound batch in a transaction, raising if any statement fails"""
+        status, row_counts = transaction.batch_update(batch)
+        # batch_update stops at the first failing statement; raising rolls
+        # back the ones before it
+        if status.code != 0:
+            raise RuntimeError(
+                f"Statement {len(row_counts) + 1} of {len(batch)} failed: {status.message}"
+            )
+
+    def execute_dml_returning(
+        self,
+        query: str,
+        params: Optional[Union[tuple, Dict[str, Any]]] = None,
+        follow_up: Optional[
+            Callable[[Dict[str, Any]], List[Tuple[str, Optional[Union[tuple, Dict[str, Any]]]]]]
+        ] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute a DML statement with a RETURNING clause and return its rows
+
+        Args:
+            query: DML statement with a RETURNING clause
+            params: Parameters for the statement
+            follow_up: Builds (query, params) pairs from the first returned
+                row; they run with batch_update in the same transaction, so
+                a failure rolls back the RETURNING statement too
+
+        Returns:
+            list: Returned rows, or [] if any statement failed
+        """
+        try:
+            if not self.database:
+                logger.error("No database connection available")
+                return []
+            
+            query, spanner_params, spanner_param_types = self._bind_params(query, params)
+            
+            # RETURNING rows come back through execute_sql, not execute_update
+            def execute_dml_in_transaction(transaction):
+                if spanner_params:
+                    results_iter = transaction.execute_sql(query, params=spanner_params, param_types=spanner_param_types)
+                else:
+                    results_iter = transaction.execute_sql(query)
+                rows_data = list(results_iter)
+                rows = self._rows_to_dicts(query, results_iter, rows_data)
+                if rows and follow_up is not None:
+                    self._run_batch_update(transaction, self._bind_batch(follow_up(rows[0])))
+                return rows
+            
+            return self.database.run_in_transaction(execute_dml_in_transaction)
+                
+        except Exception as e:
+            logger.error(f"DML execution failed: {str(e)}")
+            return []
+
+    def upsert_row(self, table: str, row: Dict[str, Any]) -> bool:
+        """
+        Insert or overwrite one row with an insert_or_update mutation
+
+        A blind write: no SQL runs and no rows are read or locked, so it
+        doesn't conflict with transactions reading other rows.
+
+        Returns:
+            bool: True if the mutation was committed
+        """
+        try:
+            if not self.database:
+                logger.error("No database connection available")
+                return False
+            
+            with self.database.batch() as batch:
+                batch.insert_or_update(table=table, columns=tuple(row), values=[tuple(row.values())])
+            return True
+                
+        except Exception as e:
+            logger.error(f"Upsert into {table} failed: {str(e)}")
+            return False
+
     def get_provider_name(self) -> str:
         """Get the database provider name"""
         return self.provider_name
@@ -1329,30 +1593,38 @@ class SpannerConnector(BaseDatabaseConnector):
             print("❌ No database connection available for table counts")
             return table_counts
         
-        # Use the working execute_query method instead of direct Spanner calls
         tables = [
             "warehouse", "district", "customer", "order_table", 
             "order_line", "item", "stock"
         ]
         
-        for table in tables:
-            try:
-                print(f"🔍 Testing table====================: {table}")
-                # Use execute_query which handles Spanner results properly
-                result = self.execute_query(f"SELECT COUNT(*) as count FROM {table}")
-                count = result[0]["count"] if result and len(result) > 0 else 0
-                table_counts[table] = count
-                print(f"   ✅ {table}: {count} records")
-                        
-            except Exception as e:
-                print(f"   ❌ Error counting {table}: {str(e)}")
-                table_counts[table] = 0
+        # Run every count inside one multi-use snapshot so a single session
+        # and read timestamp are reused instead of one snapshot per table
+        try:
+            with self.database.snapshot(multi_use=True) as snapshot:
+                for table in tables:
+                    try:
+                        rows = list(snapshot.execute_sql(f"SELECT COUNT(*) FROM {table}"))
+                        table_counts[table] = rows[0][0] if rows else 0
+                    except Exception as e:
+                        print(f"   ❌ Error counting {table}: {str(e)}")
+                        table_counts[table] = 0
+        except Exception as e:
+            logger.error(f"Failed to get table counts: {str(e)}")
+            print(f"❌ Failed to get table counts: {str(e)}")
+            for table in tables:
+                table_counts.setdefault(table, 0)
         
+        print(f"   ✅ Table counts: {table_counts}")
         return table_counts
 
     def close_connection(self):
         """Close database connection"""
         try:
+            # Delete the pooled sessions server-side rather than leaving them
+            # to expire against the instance's session limit
+            if self.pool:
+                self.pool.clear()
             if self.client:
                 self.client.close()
                 print("✅ Spanner connection closed")
@@ -3,13 +3,233 @@ Study Analytics Service - Simplified version for UX study
 Uses skeleton connectors that participants will implement
 """
 
+import asyncio
 import logging
-from typing import Any, Dict
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
-from database.connector_factory import create_study_connector
+from database.base_connector import BaseDatabaseConnector
 
 logger = logging.getLogger(__name__)
 
+# Connector shared by every AnalyticsService that isn't given one, so the
+# Spanner client and its session pool are only built once per process
+_SHARED_CONNECTOR: Optional[BaseDatabaseConnector] = None
+_SHARED_CONNECTOR_LOCK = threading.Lock()
+
+
+def _get_shared_connector() -> BaseDatabaseConnector:
+    """Return the process-wide study connector, creating it on first use"""
+    global _SHARED_CONNECTOR
+    if _SHARED_CONNECTOR is None:
+        with _SHARED_CONNECTOR_LOCK:
+            if _SHARED_CONNECTOR is None:
+                # Imported here so services built with an injected connector
+                # never load the factory and its provider modules
+                from database.connector_factory import create_study_connector
+
+                _SHARED_CONNECTOR = create_study_connector()
+    return _SHARED_CONNECTOR
+
+
+# Every dashboard metric in one round-trip. order_table and history are each
+# scanned once in a derived table; the o_entry_d window rides along in the
+# order_table scan so it needs no index of its own. Order value sums
+# order_line alone - its (w, d, o) key already references order_table
+_DASHBOARD_METRICS_QUERY = """
+    SELECT
+        (SELECT COUNT(*) FROM warehouse) AS total_warehouses,
+        (SELECT COUNT(*) FROM customer) AS total_customers,
+        o.total_orders,
+        (SELECT COUNT(*) FROM item) AS total_items,
+        o.total_orders - o.carried_orders AS new_orders,
+        (SELECT COUNT(*) FROM stock WHERE s_quantity < 50) AS low_stock_items,
+        o.orders_last_24h,
+        (SELECT COALESCE(SUM(ol_amount), 0) FROM order_line) AS total_order_value,
+        (
+            SELECT COALESCE(SUM(s.s_quantity * i.i_price), 0)
+            FROM stock s
+            JOIN item i ON i.i_id = s.s_i_id
+        ) AS total_stock_value,
+        h.payment_count,
+        h.total_payments,
+        h.avg_payment,
+        (SELECT COUNT(DISTINCT c_id) FROM customer) AS active_customers,
+        o.customers_with_orders
+    FROM (
+        SELECT COUNT(*) AS total_orders,
+               COUNT(o_carrier_id) AS carried_orders,
+               COUNT(CASE WHEN o_entry_d >= @since THEN 1 END) AS orders_last_24h,
+               COUNT(DISTINCT o_c_id) AS customers_with_orders
+        FROM order_table
+    ) o
+    CROSS JOIN (
+        SELECT COUNT(*) AS payment_count,
+               COALESCE(SUM(h_amount), 0) AS total_payments,
+               COALESCE(AVG(h_amount), 0) AS avg_payment
+        FROM history
+    ) h
+"""
+# Independent per-table queries producing the same columns as the combined
+# query, used when a backend rejects it: (statement name, query, needs the
+# @since window)
+_FALLBACK_METRIC_QUERIES = (
+    ("metrics_warehouse", "SELECT COUNT(*) AS total_warehouses FROM warehouse", False),
+    (
+        "metrics_customer",
+        "SELECT COUNT(*) AS total_customers, COUNT(DISTINCT c_id) AS active_customers FROM customer",
+        False,
+    ),
+    ("metrics_item", "SELECT COUNT(*) AS total_items FROM item", False),
+    (
+        "metrics_low_stock",
+        "SELECT COUNT(*) AS low_stock_items FROM stock WHERE s_quantity < 50",
+        False,
+    ),
+    (
+        "metrics_orders",
+        """
+        SELECT COUNT(*) AS total_orders,
+               COUNT(*) - COUNT(o_carrier_id) AS new_orders,
+               COUNT(CASE WHEN o_entry_d >= @since THEN 1 END) AS orders_last_24h,
+               COUNT(DISTINCT o_c_id) AS customers_with_orders
+        FROM order_table
+        """,
+        True,
+    ),
+    (
+        "metrics_order_value",
+        "SELECT COALESCE(SUM(ol_amount), 0) AS total_order_value FROM order_line",
+        False,
+    ),
+    (
+        "metrics_stock_value",
+        """
+        SELECT COALESCE(SUM(s.s_quantity * i.i_price), 0) AS total_stock_value
+        FROM stock s
+        JOIN item i ON i.i_id = s.s_i_id
+        """,
+        False,
+    ),
+    (
+        "metrics_payments",
+        """
+        SELECT COUNT(*) AS payment_count,
+               COALESCE(SUM(h_amount), 0) AS total_payments,
+               COALESCE(AVG(h_amount), 0) AS avg_payment
+        FROM history
+        """,
+        False,
+    ),
+)
+_FALLBACK_MAX_WORKERS = 8
+# List queries behind get_orders/get_inventory; only the LIMIT varies, so
+# they are registered as named statements alongside the dashboard queries
+_RECENT_ORDERS_QUERY = """
+    SELECT o_id, o_w_id, o_d_id, o_c_id, o_entry_d, o_ol_cnt, o_all_local
+    FROM order_table
+    ORDER BY o_entry_d DESC
+    LIMIT @limit
+"""
+_LOW_STOCK_INVENTORY_QUERY = """
+    SELECT s.s_i_id, i.i_name, s.s_w_id, s.s_quantity, i.i_price
+    FROM stock s
+    JOIN item i ON s.s_i_id = i.i_id
+    WHERE s.s_quantity < 50
+    ORDER BY s.s_quantity ASC
+    LIMIT @limit
+"""
+# get_orders/get_inventory payloads are cached per (method, limit); the limit
+# comes from callers, so the cache is simply dropped if it grows past this
+_RESULTS_CACHE_TTL = 15.0
+_RESULTS_CACHE_MAX_ENTRIES = 128
+_RECENT_ORDERS_WINDOW = timedelta(hours=24)
+
+# Spanner has no materialized views, so the combined metrics row is kept in a
+# one-row summary table that every replica reads first. A stale or missing
+# row falls back to the live query, which then schedules a refresh
+_SUMMARY_COLUMNS = (
+    "total_warehouses",
+    "total_customers",
+    "total_orders",
+    "total_items",
+    "new_orders",
+    "low_stock_items",
+    "orders_last_24h",
+    "total_order_value",
+    "total_stock_value",
+    "payment_count",
+    "total_payments",
+    "avg_payment",
+    "active_customers",
+    "customers_with_orders",
+)
+_SUMMARY_MAX_AGE = timedelta(minutes=5)
+_SUMMARY_NUMERIC_COLUMNS = (
+    "total_order_value",
+    "total_stock_value",
+    "total_payments",
+    "avg_payment",
+)
+DASHBOARD_SUMMARY_DDL = (
+    "CREATE TABLE IF NOT EXISTS dashboard_metrics_summary (\n"
+    "    summary_id bigint NOT NULL,\n"
+    + "".join(
+        f"    {column} {'numeric' if column in _SUMMARY_NUMERIC_COLUMNS else 'bigint'},\n"
+        for column in _SUMMARY_COLUMNS
+    )
+    + "    refreshed_at timestamptz NOT NULL,\n"
+    "    PRIMARY KEY (summary_id)\n"
+    ")"
+)
+_DASHBOARD_SUMMARY_QUERY = f"""
+    SELECT {", ".join(_SUMMARY_COLUMNS)}
+    FROM dashboard_metrics_summary
+    WHERE summary_id = 1 AND refreshed_at >= @fresh_since
+"""
+_SUMMARY_TABLE_EXISTS_QUERY = """
+    SELECT COUNT(*) AS table_count
+    FROM information_schema.tables
+    WHERE table_name = 'dashboard_metrics_summary'
+"""
+_COUNT_METRIC_KEYS = (
+    "total_warehouses",
+    "total_customers",
+    "total_orders",
+    "total_items",
+    "new_orders",
+    "low_stock_items",
+    "orders_last_24h",
+)
+
+# Read-only template for the payload returned when metrics can't be loaded;
+# callers get a copy since the result is handed to jsonify
+_DEFAULT_METRICS: Mapping[str, float] = types.MappingProxyType(
+    {
+        "total_warehouses": 0,
+        "total_customers": 0,
+        "total_orders": 0,
+        "total_items": 0,
+        "new_orders": 0,
+        "low_stock_items": 0,
+        "orders_last_24h": 0,
+        "avg_order_value": 0.0,
+        "total_revenue": 0.0,
+        "avg_customer_orders": 0.0,
+        "total_stock_value": 0.0,
+        "total_payments": 0,
+        "total_payment_amount": 0.0,
+        "avg_payment_amount": 0.0,
+        "customers_with_orders": 0,
+        "customer_activity_rate": 0.0,
+    }
+)
+
 
 class AnalyticsService:
     """
@@ -19,25 +239,91 @@ class AnalyticsService:
     that participants will implement during the study.
     """
 
-    def __init__(self, db_connector=None):
-        """Initialize the study analytics service"""
+    def __init__(
+        self,
+        db_connector=None,
+        metrics_ttl: float = 10.0,
+        use_summary_table: bool = False,
+    ):
+        """
+        Initialize the study analytics service
+
+        Args:
+            db_connector: Connector to use instead of the shared one
+            metrics_ttl: Seconds a successful dashboard payload is reused
+            use_summary_table: Serve the dashboard from the shared
+                dashboard_metrics_summary table (see create_dashboard_summary)
+        """
+        # Successful dashboard payload cached as (time.monotonic(), result);
+        # the lock keeps concurrent misses from all recomputing it
+        self._metrics_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._metrics_ttl = metrics_ttl
+        self._metrics_lock = threading.Lock()
+        self._results_cache: Dict[Tuple[str, int], Tuple[float, Dict[str, Any]]] = {}
+        self.use_summary_table = use_summary_table
+        # Cleared once the summary table turns out to be missing, so later
+        # loads stop paying for a read that can't succeed
+        self._summary_available = True
+        # Set by invalidate_cache so the load after a write skips the summary
+        # row, which predates the write, and refreshes it from live data
+        self._summary_bypass = False
+        # Worker threads are only started once the fallback path submits work
+        self._executor = ThreadPoolExecutor(
+            max_workers=_FALLBACK_MAX_WORKERS, thread_name_prefix="analytics"
+        )
+
         if db_connector:
             self.connector = db_connector
+            self.provider_name = db_connector.get_provider_name()
         else:
             self.connector = None
+            self.provider_name = "Unknown"
             self._initialize_connector()
 
+        self._prepare_statements()
+
     def _initialize_connector(self):
         """Initialize the database connector for the study"""
         try:
-            self.connector = create_study_connector()
+            self.connector = _get_shared_connector()
+            self.provider_name = self.connector.get_provider_name()
             logger.info(
-                f"📊 Study Analytics Service initialized with {self.connector.get_provider_name()}"
+                f"📊 Study Analytics Service initialized with {self.provider_name}"
             )
         except Exception as e:
             logger.error(f"❌ Failed to initialize study connector: {str(e)}")
             self.connector = None
 
+    def _prepare_statements(self):
+        """Register the recurring dashboard queries as named statements"""
+        if not hasattr(self.connector, "prepare"):
+            return
+        try:
+            self.connector.prepare("dashboard_metrics", _DASHBOARD_METRICS_QUERY)
+            self.connector.prepare("dashboard_summary", _DASHBOARD_SUMMARY_QUERY)
+            self.connector.prepare("recent_orders", _RECENT_ORDERS_QUERY)
+            self.connector.prepare("low_stock_inventory", _LOW_STOCK_INVENTORY_QUERY)
+            for name, query, _ in _FALLBACK_METRIC_QUERIES:
+                self.connector.prepare(name, query)
+        except Exception as e:
+            logger.warning(f"Failed to prepare dashboard statements: {str(e)}")
+
+    def _execute_statement(
+        self, name: str, query: str, params: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Execute a named statement, or the raw query on older connectors"""
+        if hasattr(self.connector, "execute_prepared"):
+            return self.connector.execute_prepared(name, params)
+        return self.connector.execute_query(query, params)
+
+    async def _execute_statement_async(
+        self, name: str, query: str, params: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Async counterpart of _execute_statement"""
+        if hasattr(self.connector, "execute_prepared_async"):
+            return await self.connector.execute_prepared_async(name, params)
+        return await self.connector.execute_query_async(query, params)
+
     def test_connection(self) -> Dict[str, Any]:
         """
         Test database connection
@@ -49,14 +335,14 @@ class AnalyticsService:
             return {
                 "success": False,
                 "error": "No database connector available",
-                "provider": "Unknown",
+                "provider": self.provider_name,
             }
 
         try:
             success = self.connector.test_connection()
             return {
                 "success": success,
-                "provider": self.connector.get_provider_name(),
+                "provider": self.provider_name,
                 "message": "Connection successful" if success else "Connection failed",
             }
         except Exception as e:
@@ -64,7 +350,7 @@ class AnalyticsService:
             return {
                 "success": False,
                 "error": str(e),
-                "provider": self.connector.get_provider_name(),
+                "provider": self.provider_name,
             }
 
     def get_dashboard_metrics(self) -> Dict[str, Any]:
@@ -76,247 +362,330 @@ class AnalyticsService:
         """
         if not self.connector:
             logger.error("❌ No database connector available")
-            print("❌ No database connector available")
-            default_metrics = self._get_default_metrics()
-            print("📊 Using default metrics (no database connection):")
-            print("-" * 40)
-            for key, value in default_metrics.items():
-                print(f"   {key}: {value}")
-            print("-" * 40)
             return {
                 "error": "No database connector available",
-                "metrics": default_metrics,
+                "metrics": self._get_default_metrics(),
             }
 
-        try:
-            # Connection is already established, no need to test again
-            logger.info("✅ Using established database connection")
-            print("✅ Using established database connection")
-
-            # Try to get basic metrics using simple queries
-            metrics = {}
-
-            # Get warehouse count
-            try:
-                result = self.connector.execute_query(
-                    "SELECT COUNT(*) as count FROM warehouse"
-                )
-                warehouse_count = result[0]["count"] if result and len(result) > 0 else 0
-                metrics["total_warehouses"] = warehouse_count
-            except Exception as e:
-                logger.warning(f"Failed to get warehouse count: {str(e)}")
-                metrics["total_warehouses"] = 0
-
-            # Get customer count
-            try:
-                result = self.connector.execute_query(
-                    "SELECT COUNT(*) as count FROM customer"
-                )
-                customer_count = result[0]["count"] if result and len(result) > 0 else 0
-                metrics["total_customers"] = customer_count
-            except Exception as e:
-                logger.warning(f"Failed to get customer count: {str(e)}")
-                metrics["total_customers"] = 0
-
-            # Get order count
-            try:
-                result = self.connector.execute_query(
-                    "SELECT COUNT(*) as count FROM order_table"
-                )
-                order_count = result[0]["count"] if result and len(result) > 0 else 0
-                metrics["total_orders"] = order_count
-            except Exception as e:
-                logger.warning(f"Failed to get order count: {str(e)}")
-                metrics["total_orders"] = 0
+        cached = self._get_cached_metrics()
+        if cached is not None:
+            return cached
 
-            # Get item count
-            try:
-                result = self.connector.execute_query(
-                    "SELECT COUNT(*) as count FROM item"
-                )
-                item_count = result[0]["count"] if result and len(result) > 0 else 0
-                metrics["total_items"] = item_count
-            except Exception as e:
-                logger.warning(f"Failed to get item count: {str(e)}")
-                metrics["total_items"] = 0
+        with self._metrics_lock:
+            # Another thread may have refreshed the cache while we waited
+            cached = self._get_cached_metrics()
+            if cached is not None:
+                return cached
 
-            # Get additional metrics for dashboard
-            # New orders (orders with o_carrier_id IS NULL)
-            try:
-                result = self.connector.execute_query(
-                    "SELECT COUNT(*) as count FROM order_table WHERE o_carrier_id IS NULL"
-                )
-                new_orders_count = result[0]["count"] if result and len(result) > 0 else 0
-                metrics["new_orders"] = new_orders_count
-            except Exception as e:
-                logger.warning(f"Failed to get new orders count: {str(e)}")
-                metrics["new_orders"] = 0
+            result = self._fetch_dashboard_metrics()
+            if result.get("success"):
+                self._metrics_cache = (time.monotonic(), result)
+            return result
 
-            # Low stock items (stock with quantity < 50)
-            try:
-                result = self.connector.execute_query(
-                    "SELECT COUNT(*) as count FROM stock WHERE s_quantity < 50"
-                )
-                low_stock_count = result[0]["count"] if result and len(result) > 0 else 0
-                metrics["low_stock_items"] = low_stock_count
-            except Exception as e:
-                logger.warning(f"Failed to get low stock items count: {str(e)}")
-                metrics["low_stock_items"] = 0
+    def _fetch_dashboard_metrics(self) -> Dict[str, Any]:
+        """Query the dashboard metrics from the database"""
+        try:
+            result = self._read_dashboard_summary()
+            if not result:
+                params = self._metrics_params()
+                try:
+                    result = self._execute_statement(
+                        "dashboard_metrics", _DASHBOARD_METRICS_QUERY, params
+                    )
+                except Exception as e:
+                    logger.warning("Combined dashboard metrics query failed: %s", e)
+                    result = None
+                if not result:
+                    result = self._fetch_fallback_metrics(params)
+                self._schedule_summary_refresh(self._first_row(result))
+            metrics = self._build_metrics(result)
 
-            # Orders in last 24 hours (simplified - just get recent orders)
-            try:
-                result = self.connector.execute_query(
-                    "SELECT COUNT(*) as count FROM order_table"
-                )
-                recent_orders_count = result[0]["count"] if result and len(result) > 0 else 0
-                metrics["orders_last_24h"] = recent_orders_count
-            except Exception as e:
-                logger.warning(f"Failed to get recent orders count: {str(e)}")
-                metrics["orders_last_24h"] = 0
+            logger.info("🎉 All dashboard metrics retrieved successfully")
+            
+            return {
+                "success": True,
+                "provider": self.provider_name,
+                "metrics": metrics,
+            }
 
-            # Average order value (actual calculation)
-            try:
-                # Get total order value by summing order_line amounts
-                order_value_result = self.connector.execute_query("""
-                    SELECT COALESCE(SUM(ol.ol_amount), 0) as total_order_value
-                    FROM order_line ol
-                    JOIN order_table o ON o.o_id = ol.ol_o_id 
-                        AND o.o_w_id = ol.ol_w_id 
-                        AND o.o_d_id = ol.ol_d_id
-                """)
-                
-                total_order_value = order_value_result[0]["total_order_value"] if order_value_result and len(order_value_result) > 0 else 0
-                
-                # Get total number of orders
-                order_count_result = self.connector.execute_query("SELECT COUNT(*) as order_count FROM order_table")
-                total_orders = order_count_result[0]["order_count"] if order_count_result and len(order_count_result) > 0 else 0
-                
-                # Calculate average order value
-                if total_orders > 0:
-                    metrics["avg_order_value"] = round(total_order_value / total_orders, 2)
-                else:
-                    metrics["avg_order_value"] = 0.0
-                    
-                # Store total revenue for other calculations
-                metrics["total_revenue"] = round(total_order_value, 2)
-                    
-                logger.info(f"   Calculated average order value: ${metrics['avg_order_value']:.2f} from {total_orders} orders")
-                
-            except Exception as e:
-                logger.warning(f"Failed to calculate average order value: {str(e)}")
-                metrics["avg_order_value"] = 0.0
-                metrics["total_revenue"] = 0.0
+        except Exception as e:
+            logger.error("Failed to get dashboard metrics: %s", e)
+            return {
+                "error": str(e),
+                "provider": self.provider_name,
+                "metrics": self._get_default_metrics(),
+            }
 
-            # Average customer order count
-            try:
-                if metrics.get("total_customers", 0) > 0:
-                    metrics["avg_customer_orders"] = round(metrics["total_orders"] / metrics["total_customers"], 2)
-                else:
-                    metrics["avg_customer_orders"] = 0.0
-                logger.info(f"   Calculated average customer orders: {metrics['avg_customer_orders']:.2f}")
-            except Exception as e:
-                logger.warning(f"Failed to calculate average customer orders: {str(e)}")
-                metrics["avg_customer_orders"] = 0.0
+    async def get_dashboard_metrics_async(self) -> Dict[str, Any]:
+        """
+        Get dashboard metrics without blocking the event loop
 
-            # Total stock value
-            try:
-                stock_value_result = self.connector.execute_query("""
-                    SELECT COALESCE(SUM(s.s_quantity * i.i_price), 0) as total_stock_value
-                    FROM stock s
-                    JOIN item i ON i.i_id = s.s_i_id
-                """)
-                
-                total_stock_value = stock_value_result[0]["total_stock_value"] if stock_value_result and len(stock_value_result) > 0 else 0
-                metrics["total_stock_value"] = round(total_stock_value, 2)
-                logger.info(f"   Calculated total stock value: ${metrics['total_stock_value']:.2f}")
-                
-            except Exception as e:
-                logger.warning(f"Failed to calculate total stock value: {str(e)}")
-                metrics["total_stock_value"] = 0.0
+        Returns:
+            dict: Dashboard metrics or error information
+        """
+        if not self.connector:
+            return self.get_dashboard_metrics()
 
-            # Payment metrics
-            try:
-                payment_result = self.connector.execute_query("""
-                    SELECT COUNT(*) as payment_count, COALESCE(SUM(h_amount), 0) as total_payments
-                    FROM history
-                """)
-                
-                if payment_result and len(payment_result) > 0:
-                    payment_count = payment_result[0]["payment_count"]
-                    total_payments = payment_result[0]["total_payments"]
-                    
-                    metrics["total_payments"] = payment_count
-                    metrics["total_payment_amount"] = round(total_payments, 2)
-                    
-                    # Calculate average payment amount
-                    if payment_count > 0:
-                        metrics["avg_payment_amount"] = round(total_payments / payment_count, 2)
-                    else:
-                        metrics["avg_payment_amount"] = 0.0
-                        
-                    logger.info(f"   Calculated payment metrics: {payment_count} payments, avg: ${metrics['avg_payment_amount']:.2f}")
-                else:
-                    metrics["total_payments"] = 0
-                    metrics["total_payment_amount"] = 0.0
-                    metrics["avg_payment_amount"] = 0.0
-                    
-            except Exception as e:
-                logger.warning(f"Failed to calculate payment metrics: {str(e)}")
-                metrics["total_payments"] = 0
-                metrics["total_payment_amount"] = 0.0
-                metrics["avg_payment_amount"] = 0.0
+        cached = self._get_cached_metrics()
+        if cached is not None:
+            return cached
 
-            # Customer activity metrics
-            try:
-                customer_activity_result = self.connector.execute_query("""
-                    SELECT 
-                        COUNT(DISTINCT c.c_id) as active_customers,
-                        COUNT(DISTINCT o.o_c_id) as customers_with_orders
-                    FROM customer c
-                    LEFT JOIN order_table o ON c.c_id = o.o_c_id AND c.c_w_id = o.o_w_id AND c.c_d_id = o.o_d_id
-                """)
-                
-                if customer_activity_result and len(customer_activity_result) > 0:
-                    total_customers = customer_activity_result[0]["active_customers"]
-                    customers_with_orders = customer_activity_result[0]["customers_with_orders"]
-                    
-                    metrics["customers_with_orders"] = customers_with_orders
-                    
-                    # Calculate customer activity percentage
-                    if total_customers > 0:
-                        metrics["customer_activity_rate"] = round((customers_with_orders / total_customers) * 100, 1)
-                    else:
-                        metrics["customer_activity_rate"] = 0.0
-                        
-                    logger.info(f"   Calculated customer activity: {customers_with_orders}/{total_customers} ({metrics['customer_activity_rate']:.1f}%)")
-                else:
-                    metrics["customers_with_orders"] = 0
-                    metrics["customer_activity_rate"] = 0.0
-                    
-            except Exception as e:
-                logger.warning(f"Failed to calculate customer activity metrics: {str(e)}")
-                metrics["customers_with_orders"] = 0
-                metrics["customer_activity_rate"] = 0.0
+        try:
+            # Same gating and error handling as the sync path, off the event loop
+            result = await asyncio.to_thread(self._read_dashboard_summary)
+            if not result:
+                params = self._metrics_params()
+                try:
+                    result = await self._execute_statement_async(
+                        "dashboard_metrics", _DASHBOARD_METRICS_QUERY, params
+                    )
+                except Exception as e:
+                    logger.warning("Combined dashboard metrics query failed: %s", e)
+                    result = None
+                if not result:
+                    result = await self._fetch_fallback_metrics_async(params)
+                self._schedule_summary_refresh(self._first_row(result))
+            metrics = self._build_metrics(result)
 
             logger.info("🎉 All dashboard metrics retrieved successfully")
-            
-            return {
+
+            payload = {
                 "success": True,
-                "provider": self.connector.get_provider_name(),
+                "provider": self.provider_name,
                 "metrics": metrics,
             }
+            self._metrics_cache = (time.monotonic(), payload)
+            return payload
 
         except Exception as e:
-            logger.error(f"Failed to get dashboard metrics: {str(e)}")
-            print(f"❌ Failed to get dashboard metrics: {str(e)}")
+            logger.error("Failed to get dashboard metrics: %s", e)
             return {
                 "error": str(e),
-                "provider": self.connector.get_provider_name()
-                if self.connector
-                else "Unknown",
+                "provider": self.provider_name,
                 "metrics": self._get_default_metrics(),
             }
 
+    def _fetch_fallback_metrics(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Run the per-table metric queries concurrently and merge their rows
+
+        Used when the combined query is rejected; the queries are independent
+        so wall-clock time is the slowest one rather than their sum.
+        """
+        logger.debug("Falling back to concurrent per-table metric queries")
+        futures = [
+            self._executor.submit(
+                self._execute_statement, name, query, params if windowed else None
+            )
+            for name, query, windowed in _FALLBACK_METRIC_QUERIES
+        ]
+
+        row = {}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.warning("Failed to get dashboard metric: %s", e)
+                continue
+            row.update(self._first_row(result))
+        return [row]
+
+    async def _fetch_fallback_metrics_async(
+        self, params: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """Async counterpart of _fetch_fallback_metrics"""
+        logger.debug("Falling back to concurrent per-table metric queries")
+        results = await asyncio.gather(
+            *(
+                self._execute_statement_async(name, query, params if windowed else None)
+                for name, query, windowed in _FALLBACK_METRIC_QUERIES
+            ),
+            return_exceptions=True,
+        )
+
+        row = {}
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.warning("Failed to get dashboard metric: %s", result)
+            else:
+                row.update(self._first_row(result))
+        return [row]
+
+    def _get_cached_metrics(self) -> Optional[Dict[str, Any]]:
+        """Return the cached dashboard payload if it is still fresh"""
+        cache = self._metrics_cache
+        if cache is not None and time.monotonic() - cache[0] < self._metrics_ttl:
+            return cache[1]
+        return None
+
+    def _get_cached_result(self, key: Tuple[str, int]) -> Optional[Dict[str, Any]]:
+        """Return a cached list payload if it is still fresh"""
+        entry = self._results_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < _RESULTS_CACHE_TTL:
+            return entry[1]
+        return None
+
+    def _cache_result(self, key: Tuple[str, int], payload: Dict[str, Any]):
+        """Cache a list payload; empty results may be a swallowed query error"""
+        if len(self._results_cache) >= _RESULTS_CACHE_MAX_ENTRIES:
+            self._results_cache.clear()
+        self._results_cache[key] = (time.monotonic(), payload)
+
+    def invalidate_cache(self):
+        """Drop the cached dashboard metrics and list results, e.g. after a write"""
+        self._metrics_cache = None
+        self._summary_bypass = True
+        self._results_cache.clear()
+
+    def _metrics_params(self) -> Dict[str, Any]:
+        """Parameters for the dashboard metrics query"""
+        return {"since": datetime.now(timezone.utc) - _RECENT_ORDERS_WINDOW}
+
+    def _summary_params(self) -> Dict[str, Any]:
+        """Parameters for the dashboard summary read"""
+        return {"fresh_since": datetime.now(timezone.utc) - _SUMMARY_MAX_AGE}
+
+    def _read_dashboard_summary(self) -> List[Dict[str, Any]]:
+        """Read the summary row if it is fresh, or [] to use the live query"""
+        if not self.use_summary_table or not self._summary_available:
+            return []
+        if self._summary_bypass:
+            self._summary_bypass = False
+            return []
+        try:
+            return self._execute_statement(
+                "dashboard_summary", _DASHBOARD_SUMMARY_QUERY, self._summary_params()
+            )
+        except Exception as e:
+            logger.warning("Dashboard summary read failed: %s", e)
+            return []
+
+    def _schedule_summary_refresh(self, row: Mapping[str, Any]):
+        """Write a freshly read metrics row to the summary table in the background"""
+        # Without the summary read there is nothing to keep fresh
+        if not self.use_summary_table or not self._summary_available:
+            return
+        # A partial fallback row would be served as zeros until it went stale
+        if any(column not in row for column in _SUMMARY_COLUMNS):
+            return
+        try:
+            self._executor.submit(self.refresh_dashboard_summary, row)
+        except RuntimeError:
+            # Executor already shut down by close()
+            pass
+
+    def create_dashboard_summary(self) -> bool:
+        """
+        Create and populate the dashboard_metrics_summary table
+
+        Returns:
+            bool: True if the table exists and was refreshed
+        """
+        if not hasattr(self.connector, "execute_ddl"):
+            return False
+        if not self.connector.execute_ddl(DASHBOARD_SUMMARY_DDL):
+            return False
+        self._summary_available = True
+        return self.refresh_dashboard_summary()
+
+    def refresh_dashboard_summary(self, row: Optional[Mapping[str, Any]] = None) -> bool:
+        """
+        Write a metrics row to the summary table
+
+        Args:
+            row: Combined metrics row already read by the caller; when omitted
+                the live metrics query is run first
+
+        Returns:
+            bool: True if the row was written
+        """
+        if not self._summary_available or not hasattr(self.connector, "upsert_row"):
+            return False
+        if row is None:
+            row = self._first_row(
+                self._execute_statement(
+                    "dashboard_metrics", _DASHBOARD_METRICS_QUERY, self._metrics_params()
+                )
+            )
+            if not row:
+                return False
+        summary_row = {"summary_id": 1}
+        for column in _SUMMARY_COLUMNS:
+            value = row.get(column)
+            if value is not None:
+                # PG numeric columns take Decimal values in mutations
+                value = Decimal(str(value)) if column in _SUMMARY_NUMERIC_COLUMNS else int(value)
+            summary_row[column] = value
+        summary_row["refreshed_at"] = datetime.now(timezone.utc)
+        if self.connector.upsert_row("dashboard_metrics_summary", summary_row):
+            logger.info("📊 Dashboard metrics summary refreshed")
+            return True
+        # upsert_row reports every failure as False, so only stop using the
+        # table once it is confirmed missing; transient aborts just retry later
+        if self._summary_table_missing():
+            logger.warning("dashboard_metrics_summary unavailable, using live metrics")
+            self._summary_available = False
+        return False
+
+    def _summary_table_missing(self) -> bool:
+        """True only if the catalog confirms the summary table doesn't exist"""
+        try:
+            rows = self.connector.execute_query(_SUMMARY_TABLE_EXISTS_QUERY)
+        except Exception as e:
+            logger.warning("Summary table lookup failed: %s", e)
+            return False
+        return bool(rows) and not rows[0].get("table_count")
+
+    @staticmethod
+    def _first_row(result) -> Dict[str, Any]:
+        """First row of a query result, or {} when it returned nothing"""
+        return result[0] if result else {}
+
+    def _build_metrics(self, result) -> Dict[str, Any]:
+        """Turn the dashboard metrics row into the metrics dict, deriving averages"""
+        row = self._first_row(result)
+        if not row:
+            logger.warning("Dashboard metrics query returned no rows")
+
+        metrics = {key: row.get(key) or 0 for key in _COUNT_METRIC_KEYS}
+
+        # Average order value and total revenue from order_line amounts
+        total_orders = metrics["total_orders"]
+        total_order_value = row.get("total_order_value") or 0
+        if total_orders > 0:
+            metrics["avg_order_value"] = round(total_order_value / total_orders, 2)
+        else:
+            metrics["avg_order_value"] = 0.0
+        metrics["total_revenue"] = round(total_order_value, 2)
+
+        # Average customer order count
+        if metrics["total_customers"] > 0:
+            metrics["avg_customer_orders"] = round(total_orders / metrics["total_customers"], 2)
+        else:
+            metrics["avg_customer_orders"] = 0.0
+
+        # Total stock value
+        metrics["total_stock_value"] = round(row.get("total_stock_value") or 0, 2)
+
+        # Payment metrics
+        payment_count = row.get("payment_count") or 0
+        total_payments = row.get("total_payments") or 0
+        metrics["total_payments"] = payment_count
+        metrics["total_payment_amount"] = round(total_payments, 2)
+        metrics["avg_payment_amount"] = round(row.get("avg_payment") or 0.0, 2)
+
+        # Customer activity metrics
+        active_customers = row.get("active_customers") or 0
+        customers_with_orders = row.get("customers_with_orders") or 0
+        metrics["customers_with_orders"] = customers_with_orders
+        if active_customers > 0:
+            metrics["customer_activity_rate"] = round((customers_with_orders / active_customers) * 100, 1)
+        else:
+            metrics["customer_activity_rate"] = 0.0
+
+        logger.debug("metrics=%r", metrics)
+        return metrics
+
     def get_orders(self, limit: int = 10) -> Dict[str, Any]:
         """
         Get recent orders for the study webapp
@@ -330,32 +699,32 @@ class AnalyticsService:
         if not self.connector:
             return {"error": "No database connector available", "orders": []}
 
-        try:
-            if not self.connector.test_connection():
-                return {"error": "Database connection failed", "orders": []}
+        cache_key = ("orders", int(limit))
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            return cached
 
-            query = """
-                SELECT o_id, o_w_id, o_d_id, o_c_id, o_entry_d, o_ol_cnt, o_all_local
-                FROM order_table 
-                ORDER BY o_entry_d DESC 
-                LIMIT @limit
-            """
+        try:
+            # Connection is already established, no need to test again
 
-            result = self.connector.execute_query(query, {"limit": limit})
+            result = self._execute_statement(
+                "recent_orders", _RECENT_ORDERS_QUERY, {"limit": int(limit)}
+            )
 
-            return {
+            payload = {
                 "success": True,
-                "provider": self.connector.get_provider_name(),
+                "provider": self.provider_name,
                 "orders": result,
             }
+            if result:
+                self._cache_result(cache_key, payload)
+            return payload
 
         except Exception as e:
             logger.error(f"Failed to get orders: {str(e)}")
             return {
                 "error": str(e),
-                "provider": self.connector.get_provider_name()
-                if self.connector
-                else "Unknown",
+                "provider": self.provider_name,
                 "orders": [],
             }
 
@@ -380,17 +749,17 @@ class AnalyticsService:
 
             result = self.connector.execute_query(query)
 
-            # Convert to list of dictionaries with proper keys
-            warehouses = []
-            for row in result:
-                warehouses.append({
-                    "w_id": row.get("w_id", row.get("count")),
-                    "w_name": row.get("w_name", f"Warehouse {row.get('w_id', row.get('count'))}"),
+            # Convert to list of dictionaries with proper keys; each lookup
+            # runs once and "count" is only consulted when w_id is missing
+            return [
+                {
+                    "w_id": (w_id := row.get("w_id") or row.get("count")),
+                    "w_name": row.get("w_name") or f"Warehouse {w_id}",
                     "w_city": row.get("w_city", "Unknown"),
-                    "w_state": row.get("w_state", "Unknown")
-                })
-
-            return warehouses
+                    "w_state": row.get("w_state", "Unknown"),
+                }
+                for row in result
+            ]
 
         except Exception as e:
             logger.error(f"Failed to get warehouses: {str(e)}")
@@ -409,59 +778,48 @@ class AnalyticsService:
         if not self.connector:
             return {"error": "No database connector available", "inventory": []}
 
+        cache_key = ("inventory", int(limit))
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             # Connection is already established, no need to test again
 
-            query = """
-                SELECT s.s_i_id, i.i_name, s.s_w_id, s.s_quantity, i.i_price
-                FROM stock s
-                JOIN item i ON s.s_i_id = i.i_id
-                WHERE s.s_quantity < 50
-                ORDER BY s.s_quantity ASC
-                LIMIT @limit
-            """
-
-            result = self.connector.execute_query(query, {"limit": limit})
+            result = self._execute_statement(
+                "low_stock_inventory", _LOW_STOCK_INVENTORY_QUERY, {"limit": int(limit)}
+            )
 
-            return {
+            payload = {
                 "success": True,
-                "provider": self.connector.get_provider_name(),
+                "provider": self.provider_name,
                 "inventory": result,
             }
+            if result:
+                self._cache_result(cache_key, payload)
+            return payload
 
         except Exception as e:
             logger.error(f"Failed to get inventory: {str(e)}")
             return {
                 "error": str(e),
-                "provider": self.connector.get_provider_name()
-                if self.connector
-                else "Unknown",
+                "provider": self.provider_name,
                 "inventory": [],
             }
 
-    def _get_default_metrics(self) -> Dict[str, int]:
+    def _get_default_metrics(self) -> Dict[str, float]:
         """Get default metrics when database is not available"""
-        return {
-            "total_warehouses": 0,
-            "total_customers": 0,
-            "total_orders": 0,
-            "total_items": 0,
-            "new_orders": 0,
-            "low_stock_items": 0,
-            "orders_last_24h": 0,
-            "avg_order_value": 0.0,
-            "total_revenue": 0.0,
-            "avg_customer_orders": 0.0,
-            "total_stock_value": 0.0,
-            "total_payments": 0,
-            "total_payment_amount": 0.0,
-            "avg_payment_amount": 0.0,
-            "customers_with_orders": 0,
-            "customer_activity_rate": 0.0,
-        }
+        return dict(_DEFAULT_METRICS)
 
     def close(self):
         """Close database connections"""
+        self._executor.shutdown(wait=False)
+        self.invalidate_cache()
+        if self.connector is _SHARED_CONNECTOR:
+            # Other instances still use the process-wide connector, so only
+            # drop this instance's reference to it
+            self.connector = None
+            return
         if self.connector:
             try:
                 self.connector.close_connection()
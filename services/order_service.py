@@ -2,14 +2,73 @@
 Order service for TPC-C operations
 """
 
+import asyncio
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 from database.base_connector import BaseDatabaseConnector
 
 logger = logging.getLogger(__name__)
 
+# Order statistics are two aggregate queries per warehouse filter, so results
+# are reused for a minute and dropped when this service creates an order.
+# Warehouse IDs come from callers, so the cache is dropped if it grows past
+# the entry limit
+_STATS_CACHE_TTL = 60.0
+_STATS_CACHE_MAX_ENTRIES = 128
+
+# Shared by every OrderService so the statistics threads live as long as the
+# process instead of leaking with each instance
+_STATS_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="order-stats")
+
+_ORDER_DETAILS_QUERY = """
+    SELECT o.*, c.c_first, c.c_middle, c.c_last,
+           CASE WHEN no.no_o_id IS NOT NULL THEN 'New' ELSE 'Delivered' END as status
+    FROM order_table o
+    JOIN customer c ON c.c_w_id = o.o_w_id AND c.c_d_id = o.o_d_id AND c.c_id = o.o_c_id
+    LEFT JOIN new_order no ON no.no_w_id = o.o_w_id AND no.no_d_id = o.o_d_id AND no.no_o_id = o.o_id
+    WHERE o.o_w_id = @warehouse_id AND o.o_d_id = @district_id AND o.o_id = @order_id
+"""
+_ORDER_LINES_QUERY = """
+    SELECT ol.*, i.i_name, i.i_price
+    FROM order_line ol
+    JOIN item i ON i.i_id = ol.ol_i_id
+    WHERE ol.ol_w_id = @warehouse_id AND ol.ol_d_id = @district_id AND ol.ol_o_id = @order_id
+    ORDER BY ol.ol_number
+"""
+
+# Assumes d_next_o_id was brought past existing orders once with
+# SpannerConnector.reconcile_district_order_ids()
+_CLAIM_ORDER_ID_DML = """
+    UPDATE district
+    SET d_next_o_id = d_next_o_id + 1
+    WHERE d_w_id = @warehouse_id AND d_id = @district_id
+    RETURNING d_next_o_id - 1 AS next_order_id
+"""
+# o_carrier_id is inserted as NULL explicitly
+_ORDER_INSERT_QUERY = """
+    INSERT INTO order_table (o_id, o_d_id, o_w_id, o_c_id, o_entry_d, o_carrier_id, o_ol_cnt, o_all_local, region_created)
+    VALUES (@order_id, @district_id, @warehouse_id, @customer_id, CURRENT_TIMESTAMP, NULL, @ol_cnt, @all_local, @region_created)
+"""
+_NEW_ORDER_INSERT_QUERY = """
+    INSERT INTO new_order (no_o_id, no_d_id, no_w_id)
+    VALUES (@order_id, @district_id, @warehouse_id)
+"""
+_ORDER_LINE_INSERT_QUERY = """
+    INSERT INTO order_line (ol_o_id, ol_d_id, ol_w_id, ol_number, ol_i_id, ol_supply_w_id, ol_quantity, ol_amount, ol_dist_info)
+    VALUES (@ol_o_id, @ol_d_id, @ol_w_id, @ol_number, @ol_i_id, @ol_supply_w_id, @ol_quantity, @ol_amount, @ol_dist_info)
+"""
+_STOCK_UPDATE_QUERY = """
+    UPDATE stock 
+    SET s_quantity = s_quantity - @quantity,
+        s_ytd = s_ytd + @quantity,
+        s_order_cnt = s_order_cnt + 1
+    WHERE s_i_id = @item_id AND s_w_id = @supply_warehouse_id
+"""
+
 
 class OrderService:
     """Service class for order-related operations"""
@@ -20,6 +79,7 @@ class OrderService:
         self.db = db_connector
         # Get region name from environment variable or use default
         self.region_name = region_name or os.environ.get("REGION_NAME", "default")
+        self._stats_cache: Dict[Optional[int], Tuple[float, Dict[str, Any]]] = {}
 
     def execute_new_order(
         self,
@@ -36,107 +96,84 @@ class OrderService:
             if not items:
                 return {"success": False, "error": "No items provided"}
             
-            # Get customer information
-            customer_query = """
-                SELECT c_first, c_middle, c_last, c_credit, c_discount, c_balance
-                FROM customer 
-                WHERE c_w_id = @warehouse_id AND c_d_id = @district_id AND c_id = @customer_id
+            # Customer, warehouse and district tax in one round-trip; the
+            # outer joins keep the missing warehouse/district cases apart
+            header_query = """
+                SELECT c.c_first, c.c_middle, c.c_last, c.c_credit, c.c_discount, c.c_balance,
+                       w.w_id, w.w_tax, d.d_id, d.d_tax
+                FROM customer c
+                LEFT JOIN warehouse w ON w.w_id = c.c_w_id
+                LEFT JOIN district d ON d.d_w_id = c.c_w_id AND d.d_id = c.c_d_id
+                WHERE c.c_w_id = @warehouse_id AND c.c_d_id = @district_id AND c.c_id = @customer_id
             """
-            customer_result = self.db.execute_query(customer_query, {
+            header_result = self.db.execute_query(header_query, {
                 "warehouse_id": warehouse_id,
                 "district_id": district_id,
                 "customer_id": customer_id
             })
             
-            if not customer_result:
+            if not header_result:
                 return {"success": False, "error": "Customer not found"}
             
-            customer = customer_result[0]
-            
-            # Get warehouse and district information
-            warehouse_query = """
-                SELECT w_tax, w_ytd FROM warehouse WHERE w_id = @warehouse_id
-            """
-            warehouse_result = self.db.execute_query(warehouse_query, {"warehouse_id": warehouse_id})
-            
-            if not warehouse_result:
+            customer = header_result[0]
+            if customer["w_id"] is None:
                 return {"success": False, "error": "Warehouse not found"}
+            if customer["d_id"] is None:
+                return {"success": False, "error": "District not found"}
             
-            warehouse = warehouse_result[0]
+            # Fetch every item and stock row up front instead of two queries
+            # per order line
+            item_ids = list(dict.fromkeys(item.get("item_id") for item in items))
+            supply_warehouse_ids = list(dict.fromkeys(
+                item.get("supply_warehouse_id", warehouse_id) for item in items
+            ))
             
-            district_query = """
-                SELECT d_tax, d_ytd FROM district WHERE d_w_id = @warehouse_id AND d_id = @district_id
+            item_query = """
+                SELECT i_id, i_name, i_price, i_data FROM item WHERE i_id = ANY(@item_ids)
             """
-            district_result = self.db.execute_query(district_query, {
-                "warehouse_id": warehouse_id,
-                "district_id": district_id
-            })
-            
-            if not district_result:
-                return {"success": False, "error": "District not found"}
-            
-            district = district_result[0]
+            item_rows = self.db.execute_query(item_query, {"item_ids": item_ids})
+            items_by_id = {row["i_id"]: row for row in item_rows}
             
-            # Get next order ID
-            order_id_query = """
-                SELECT COALESCE(MAX(o_id), 0) + 1 as next_order_id 
-                FROM order_table 
-                WHERE o_w_id = @warehouse_id AND o_d_id = @district_id
+            stock_query = """
+                SELECT s_i_id, s_w_id, s_quantity, s_dist_01, s_dist_02, s_dist_03, s_dist_04, s_dist_05,
+                       s_dist_06, s_dist_07, s_dist_08, s_dist_09, s_dist_10, s_ytd, s_order_cnt, s_remote_cnt
+                FROM stock 
+                WHERE s_i_id = ANY(@item_ids) AND s_w_id = ANY(@supply_warehouse_ids)
             """
-            order_id_result = self.db.execute_query(order_id_query, {
-                "warehouse_id": warehouse_id,
-                "district_id": district_id
+            stock_rows = self.db.execute_query(stock_query, {
+                "item_ids": item_ids,
+                "supply_warehouse_ids": supply_warehouse_ids
             })
-            
-            if not order_id_result:
-                return {"success": False, "error": "Failed to get next order ID"}
-            
-            order_id = order_id_result[0]["next_order_id"]
+            stock_by_key = {(row["s_i_id"], row["s_w_id"]): row for row in stock_rows}
             
             # Calculate order total
             total_amount = 0
             order_lines = []
+            all_local = 1
+            # Loop-invariant stock column holding this district's dist info
+            dist_key = f"s_dist_{district_id:02d}" if district_id <= 10 else "s_dist_01"
             
             for i, item in enumerate(items):
                 item_id = item.get("item_id")
                 supply_warehouse_id = item.get("supply_warehouse_id", warehouse_id)
                 quantity = item.get("quantity", 1)
+                if supply_warehouse_id != warehouse_id:
+                    all_local = 0
                 
-                # Get item information
-                item_query = """
-                    SELECT i_name, i_price, i_data FROM item WHERE i_id = @item_id
-                """
-                item_result = self.db.execute_query(item_query, {"item_id": item_id})
-                
-                if not item_result:
+                item_info = items_by_id.get(item_id)
+                if not item_info:
                     return {"success": False, "error": f"Item {item_id} not found"}
                 
-                item_info = item_result[0]
-                
-                # Get stock information
-                stock_query = """
-                    SELECT s_quantity, s_dist_01, s_dist_02, s_dist_03, s_dist_04, s_dist_05,
-                           s_dist_06, s_dist_07, s_dist_08, s_dist_09, s_dist_10, s_ytd, s_order_cnt, s_remote_cnt
-                    FROM stock 
-                    WHERE s_i_id = @item_id AND s_w_id = @supply_warehouse_id
-                """
-                stock_result = self.db.execute_query(stock_query, {
-                    "item_id": item_id,
-                    "supply_warehouse_id": supply_warehouse_id
-                })
-                
-                if not stock_result:
+                stock = stock_by_key.get((item_id, supply_warehouse_id))
+                if not stock:
                     return {"success": False, "error": f"Stock not found for item {item_id} in warehouse {supply_warehouse_id}"}
                 
-                stock = stock_result[0]
-                
                 # Calculate line total
                 line_amount = item_info["i_price"] * quantity
                 total_amount += line_amount
                 
                 # Prepare order line data
                 order_line = {
-                    "ol_o_id": order_id,
                     "ol_d_id": district_id,
                     "ol_w_id": warehouse_id,
                     "ol_number": i + 1,
@@ -144,86 +181,66 @@ class OrderService:
                     "ol_supply_w_id": supply_warehouse_id,
                     "ol_quantity": quantity,
                     "ol_amount": line_amount,
-                    "ol_dist_info": stock[f"s_dist_{district_id:02d}"] if district_id <= 10 else stock["s_dist_01"]
+                    "ol_dist_info": stock[dist_key]
                 }
                 order_lines.append(order_line)
             
             # Calculate final amounts
-            total_amount = total_amount * (1 + district["d_tax"] + warehouse["w_tax"]) * (1 - customer["c_discount"])
-            
-            # Create the order
-            order_data = {
-                "o_id": order_id,
-                "o_d_id": district_id,
-                "o_w_id": warehouse_id,
-                "o_c_id": customer_id,
-                "o_entry_d": "CURRENT_TIMESTAMP",
-                "o_carrier_id": None,
-                "o_ol_cnt": len(items),
-                "o_all_local": 1 if all(item.get("supply_warehouse_id", warehouse_id) == warehouse_id for item in items) else 0
-            }
+            total_amount = total_amount * (1 + customer["d_tax"] + customer["w_tax"]) * (1 - customer["c_discount"])
             
             # Actually create the order in the database
             try:
-                # Insert into order_table - handle o_carrier_id as NULL explicitly
-                order_insert_query = """
-                    INSERT INTO order_table (o_id, o_d_id, o_w_id, o_c_id, o_entry_d, o_carrier_id, o_ol_cnt, o_all_local, region_created)
-                    VALUES (@order_id, @district_id, @warehouse_id, @customer_id, CURRENT_TIMESTAMP, NULL, @ol_cnt, @all_local, @region_created)
-                """
-                if not self.db.execute_dml(order_insert_query, {
-                    "order_id": order_id,
-                    "district_id": district_id,
-                    "warehouse_id": warehouse_id,
-                    "customer_id": customer_id,
-                    "ol_cnt": len(items),
-                    "all_local": 1 if all(item.get("supply_warehouse_id", warehouse_id) == warehouse_id for item in items) else 0,
-                    "region_created": self.region_name
-                }):
-                    return {"success": False, "error": "Failed to insert order"}
-                
-                # Insert into new_order table
-                new_order_insert_query = """
-                    INSERT INTO new_order (no_o_id, no_d_id, no_w_id)
-                    VALUES (@order_id, @district_id, @warehouse_id)
-                """
-                if not self.db.execute_dml(new_order_insert_query, {
-                    "order_id": order_id,
-                    "district_id": district_id,
-                    "warehouse_id": warehouse_id
-                }):
-                    return {"success": False, "error": "Failed to insert new order"}
-                
-                # Insert order lines
-                for order_line in order_lines:
-                    line_insert_query = """
-                        INSERT INTO order_line (ol_o_id, ol_d_id, ol_w_id, ol_number, ol_i_id, ol_supply_w_id, ol_quantity, ol_amount, ol_dist_info)
-                        VALUES (@ol_o_id, @ol_d_id, @ol_w_id, @ol_number, @ol_i_id, @ol_supply_w_id, @ol_quantity, @ol_amount, @ol_dist_info)
-                    """
-                    if not self.db.execute_dml(line_insert_query, order_line):
-                        return {"success": False, "error": f"Failed to insert order line {order_line['ol_number']}"}
-                
-                # Update stock quantities
-                for item in items:
-                    item_id = item.get("item_id")
-                    supply_warehouse_id = item.get("supply_warehouse_id", warehouse_id)
-                    quantity = item.get("quantity", 1)
+                if hasattr(self.db, "execute_dml_returning"):
+                    # Claim the order ID in the same transaction as the writes
+                    # and only after validation, so rejected or failed orders
+                    # don't burn district order IDs
+                    def build_statements(row):
+                        return [
+                            (query, params)
+                            for query, params, _ in self._new_order_statements(
+                                row["next_order_id"], warehouse_id, district_id,
+                                customer_id, all_local, order_lines,
+                            )
+                        ]
                     
-                    stock_update_query = """
-                        UPDATE stock 
-                        SET s_quantity = s_quantity - @quantity,
-                            s_ytd = s_ytd + @quantity,
-                            s_order_cnt = s_order_cnt + 1
-                        WHERE s_i_id = @item_id AND s_w_id = @supply_warehouse_id
+                    claimed = self.db.execute_dml_returning(_CLAIM_ORDER_ID_DML, {
+                        "warehouse_id": warehouse_id,
+                        "district_id": district_id
+                    }, follow_up=build_statements)
+                    if not claimed:
+                        return {"success": False, "error": "Failed to write order to database"}
+                    order_id = claimed[0]["next_order_id"]
+                else:
+                    order_id_query = """
+                        SELECT COALESCE(MAX(o_id), 0) + 1 as next_order_id 
+                        FROM order_table 
+                        WHERE o_w_id = @warehouse_id AND o_d_id = @district_id
                     """
-                    if not self.db.execute_dml(stock_update_query, {
-                        "quantity": quantity,
-                        "item_id": item_id,
-                        "supply_warehouse_id": supply_warehouse_id
-                    }):
-                        return {"success": False, "error": f"Failed to update stock for item {item_id}"}
+                    order_id_result = self.db.execute_query(order_id_query, {
+                        "warehouse_id": warehouse_id,
+                        "district_id": district_id
+                    })
+                    
+                    if not order_id_result:
+                        return {"success": False, "error": "Failed to get next order ID"}
+                    
+                    order_id = order_id_result[0]["next_order_id"]
+                    statements = self._new_order_statements(
+                        order_id, warehouse_id, district_id, customer_id, all_local, order_lines
+                    )
+                    
+                    if hasattr(self.db, "execute_batch_dml"):
+                        # One transaction and round-trip for the whole order
+                        if not self.db.execute_batch_dml([(query, params) for query, params, _ in statements]):
+                            return {"success": False, "error": "Failed to write order to database"}
+                    else:
+                        for query, params, error in statements:
+                            if not self.db.execute_dml(query, params):
+                                return {"success": False, "error": error}
                 
                 logger.info(f"Order {order_id} successfully created in database with total amount: {total_amount:.2f}")
                 logger.info(f"Order lines: {len(order_lines)} lines inserted")
+                self._stats_cache.clear()
                 
                 return {
                     "success": True,
@@ -243,6 +260,47 @@ class OrderService:
             logger.error(f"New order service error: {str(e)}")
             return {"success": False, "error": str(e)}
 
+    def _new_order_statements(
+        self,
+        order_id: int,
+        warehouse_id: int,
+        district_id: int,
+        customer_id: int,
+        all_local: int,
+        order_lines: List[Dict[str, Any]],
+    ) -> List[Tuple[str, Dict[str, Any], str]]:
+        """Every write for a new order as (query, params, error if it fails)"""
+        statements = [
+            (_ORDER_INSERT_QUERY, {
+                "order_id": order_id,
+                "district_id": district_id,
+                "warehouse_id": warehouse_id,
+                "customer_id": customer_id,
+                "ol_cnt": len(order_lines),
+                "all_local": all_local,
+                "region_created": self.region_name
+            }, "Failed to insert order"),
+            (_NEW_ORDER_INSERT_QUERY, {
+                "order_id": order_id,
+                "district_id": district_id,
+                "warehouse_id": warehouse_id
+            }, "Failed to insert new order"),
+        ]
+        statements.extend(
+            (_ORDER_LINE_INSERT_QUERY, {"ol_o_id": order_id, **order_line},
+             f"Failed to insert order line {order_line['ol_number']}")
+            for order_line in order_lines
+        )
+        statements.extend(
+            (_STOCK_UPDATE_QUERY, {
+                "quantity": order_line["ol_quantity"],
+                "item_id": order_line["ol_i_id"],
+                "supply_warehouse_id": order_line["ol_supply_w_id"]
+            }, f"Failed to update stock for item {order_line['ol_i_id']}")
+            for order_line in order_lines
+        )
+        return statements
+
     def get_order_status(
         self, warehouse_id: int, district_id: int, customer_id: int
     ) -> Dict[str, Any]:
@@ -291,57 +349,82 @@ class OrderService:
                 "has_prev": False,
             }
 
+    async def execute_new_order_async(
+        self,
+        warehouse_id: int,
+        district_id: int,
+        customer_id: int,
+        items: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Run execute_new_order in a worker thread so it doesn't block the event loop"""
+        return await asyncio.to_thread(
+            self.execute_new_order, warehouse_id, district_id, customer_id, items
+        )
+
     def get_order_details(
         self, warehouse_id: int, district_id: int, order_id: int
     ) -> Dict[str, Any]:
         """Get detailed information about a specific order"""
         try:
-            # Get order information
-            order_query = """
-                SELECT o.*, c.c_first, c.c_middle, c.c_last,
-                       CASE WHEN no.no_o_id IS NOT NULL THEN 'New' ELSE 'Delivered' END as status
-                FROM order_table o
-                JOIN customer c ON c.c_w_id = o.o_w_id AND c.c_d_id = o.o_d_id AND c.c_id = o.o_c_id
-                LEFT JOIN new_order no ON no.no_w_id = o.o_w_id AND no.no_d_id = o.o_d_id AND no.no_o_id = o.o_id
-                WHERE o.o_w_id = %s AND o.o_d_id = %s AND o.o_id = %s
-            """
+            order_key = {
+                "warehouse_id": warehouse_id,
+                "district_id": district_id,
+                "order_id": order_id,
+            }
 
-            order_result = self.db.execute_query(
-                order_query, (warehouse_id, district_id, order_id)
-            )
+            order_result = self.db.execute_query(_ORDER_DETAILS_QUERY, order_key)
 
             if not order_result:
                 return {"success": False, "error": "Order not found"}
 
-            order = order_result[0]
+            order_lines = self.db.execute_query(_ORDER_LINES_QUERY, order_key)
 
-            # Get order lines
-            order_lines_query = """
-                SELECT ol.*, i.i_name, i.i_price
-                FROM order_line ol
-                JOIN item i ON i.i_id = ol.ol_i_id
-                WHERE ol.ol_w_id = %s AND ol.ol_d_id = %s AND ol.ol_o_id = %s
-                ORDER BY ol.ol_number
-            """
+            return self._order_details_result(order_result, order_lines)
+
+        except Exception as e:
+            logger.error(f"Get order details service error: {str(e)}")
+            return {"success": False, "error": str(e)}
+
+    async def get_order_details_async(
+        self, warehouse_id: int, district_id: int, order_id: int
+    ) -> Dict[str, Any]:
+        """Async counterpart of get_order_details; the order and its lines are fetched concurrently"""
+        try:
+            order_key = {
+                "warehouse_id": warehouse_id,
+                "district_id": district_id,
+                "order_id": order_id,
+            }
 
-            order_lines = self.db.execute_query(
-                order_lines_query, (warehouse_id, district_id, order_id)
+            order_result, order_lines = await asyncio.gather(
+                self.db.execute_query_async(_ORDER_DETAILS_QUERY, order_key),
+                self.db.execute_query_async(_ORDER_LINES_QUERY, order_key),
             )
 
-            # Calculate total amount
-            total_amount = sum(float(line.get("ol_amount", 0)) for line in order_lines)
+            if not order_result:
+                return {"success": False, "error": "Order not found"}
 
-            return {
-                "success": True,
-                "order": order,
-                "order_lines": order_lines,
-                "total_amount": total_amount,
-            }
+            return self._order_details_result(order_result, order_lines)
 
         except Exception as e:
             logger.error(f"Get order details service error: {str(e)}")
             return {"success": False, "error": str(e)}
 
+    @staticmethod
+    def _order_details_result(
+        order_result: List[Dict[str, Any]], order_lines: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Build the order details response from the order and its lines"""
+        # Calculate total amount
+        total_amount = sum(float(line.get("ol_amount", 0)) for line in order_lines)
+
+        return {
+            "success": True,
+            "order": order_result[0],
+            "order_lines": order_lines,
+            "total_amount": total_amount,
+        }
+
     def get_recent_orders(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get most recent orders across all warehouses"""
         try:
@@ -358,7 +441,7 @@ class OrderService:
                 LIMIT @limit
             """
 
-            return self.db.execute_query(query, {"limit": limit})
+            return self.db.execute_query(query, {"limit": int(limit)})
 
         except Exception as e:
             logger.error(f"Get recent orders service error: {str(e)}")
@@ -368,46 +451,76 @@ class OrderService:
         self, warehouse_id: Optional[int] = None
     ) -> Dict[str, Any]:
         """Get order statistics"""
-        try:
-            stats = {}
-
-            # Base query conditions
-            where_clause = "WHERE 1=1"
-            params = []
+        cached = self._get_cached_statistics(warehouse_id)
+        if cached is not None:
+            return cached
 
-            if warehouse_id:
-                where_clause += " AND o_w_id = %s"
-                params.append(warehouse_id)
+        try:
+            queries, params = self._order_statistics_queries(warehouse_id)
+            # The order_line GROUP BY dominates, so the count query runs
+            # alongside it rather than waiting
+            futures = {
+                name: _STATS_EXECUTOR.submit(self.db.execute_query, query, params)
+                for name, query in queries.items()
+            }
+            results = {name: future.result() for name, future in futures.items()}
+            return self._store_order_statistics(warehouse_id, results)
 
-            # Total orders
-            total_query = f"SELECT COUNT(*) as count FROM order_table {where_clause}"
-            total_result = self.db.execute_query(total_query, tuple(params))
-            stats["total_orders"] = total_result[0]["count"] if total_result else 0
+        except Exception as e:
+            logger.error(f"Get order statistics service error: {str(e)}")
+            return {}
 
-            # New orders
-            new_query = f"""
-                SELECT COUNT(*) as count 
-                FROM order_table o 
-                JOIN new_order no ON no.no_w_id = o.o_w_id AND no.no_d_id = o.o_d_id AND no.no_o_id = o.o_id
-                {where_clause}
-            """
-            new_result = self.db.execute_query(new_query, tuple(params))
-            stats["new_orders"] = new_result[0]["count"] if new_result else 0
+    async def get_order_statistics_async(
+        self, warehouse_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Async counterpart of get_order_statistics; the aggregates run concurrently"""
+        cached = self._get_cached_statistics(warehouse_id)
+        if cached is not None:
+            return cached
 
-            # Delivered orders
-            stats["delivered_orders"] = stats["total_orders"] - stats["new_orders"]
+        try:
+            queries, params = self._order_statistics_queries(warehouse_id)
+            values = await asyncio.gather(
+                *(self.db.execute_query_async(query, params) for query in queries.values())
+            )
+            return self._store_order_statistics(warehouse_id, dict(zip(queries, values)))
 
-            # Orders today
-            today_query = f"""
-                SELECT COUNT(*) as count 
-                FROM order_table 
-                {where_clause} AND DATE(o_entry_d) = CURRENT_DATE
-            """
-            today_result = self.db.execute_query(today_query, tuple(params))
-            stats["orders_today"] = today_result[0]["count"] if today_result else 0
+        except Exception as e:
+            logger.error(f"Get order statistics service error: {str(e)}")
+            return {}
 
+    def _get_cached_statistics(self, warehouse_id: Optional[int]) -> Optional[Dict[str, Any]]:
+        """Return cached order statistics for a warehouse filter if still fresh"""
+        cached = self._stats_cache.get(warehouse_id)
+        if cached is not None and time.monotonic() - cached[0] < _STATS_CACHE_TTL:
+            return cached[1]
+        return None
+
+    @staticmethod
+    def _order_statistics_queries(
+        warehouse_id: Optional[int],
+    ) -> Tuple[Dict[str, str], Dict[str, Any]]:
+        """Build the independent order statistics queries and their parameters"""
+        # Base query conditions
+        where_clause = "WHERE 1=1"
+        params = {}
+
+        if warehouse_id:
+            where_clause += " AND o_w_id = @warehouse_id"
+            params["warehouse_id"] = warehouse_id
+
+        queries = {
+            # Total, new and today's orders from one scan of order_table
+            "counts": f"""
+                SELECT COUNT(*) as total_orders,
+                       COUNT(no.no_o_id) as new_orders,
+                       COUNT(CASE WHEN DATE(o.o_entry_d) = CURRENT_DATE THEN 1 END) as orders_today
+                FROM order_table o 
+                LEFT JOIN new_order no ON no.no_w_id = o.o_w_id AND no.no_d_id = o.o_d_id AND no.no_o_id = o.o_id
+                {where_clause.replace("o_w_id", "o.o_w_id")}
+            """,
             # Average order value
-            avg_query = f"""
+            "avg": f"""
                 SELECT AVG(total_amount) as avg_amount
                 FROM (
                     SELECT SUM(ol_amount) as total_amount
@@ -416,16 +529,36 @@ class OrderService:
                     {where_clause.replace("o_w_id", "o.o_w_id")}
                     GROUP BY ol.ol_w_id, ol.ol_d_id, ol.ol_o_id
                 ) as order_totals
-            """
-            avg_result = self.db.execute_query(avg_query, tuple(params))
-            stats["avg_order_value"] = (
-                float(avg_result[0]["avg_amount"])
-                if avg_result and avg_result[0]["avg_amount"]
-                else 0.0
-            )
-
-            return stats
+            """,
+        }
+        return queries, params
 
-        except Exception as e:
-            logger.error(f"Get order statistics service error: {str(e)}")
-            return {}
+    def _store_order_statistics(
+        self, warehouse_id: Optional[int], results: Dict[str, List[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """Build the statistics dict from the query results and cache it if complete"""
+        stats = {}
+
+        counts = results["counts"][0] if results["counts"] else {}
+        stats["total_orders"] = counts.get("total_orders") or 0
+        stats["new_orders"] = counts.get("new_orders") or 0
+
+        # Delivered orders
+        stats["delivered_orders"] = stats["total_orders"] - stats["new_orders"]
+
+        stats["orders_today"] = counts.get("orders_today") or 0
+
+        avg_result = results["avg"]
+        stats["avg_order_value"] = (
+            float(avg_result[0]["avg_amount"])
+            if avg_result and avg_result[0]["avg_amount"]
+            else 0.0
+        )
+
+        # Both aggregates always return a row, so an empty result is a query
+        # error the connector swallowed; don't keep its zeros around
+        if results["counts"] and avg_result:
+            if len(self._stats_cache) >= _STATS_CACHE_MAX_ENTRIES:
+                self._stats_cache.clear()
+            self._stats_cache[warehouse_id] = (time.monotonic(), stats)
+        return stats
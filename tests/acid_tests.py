@@ -5,11 +5,31 @@ Tests Atomicity, Consistency, Isolation, and Durability with real database opera
 
 import logging
 import time
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, NamedTuple, Optional
 
 logger = logging.getLogger(__name__)
 
 
+class ACIDResult(NamedTuple):
+    """Outcome of a single ACID test
+
+    A NamedTuple rather than a slotted dataclass so it stays compact and
+    immutable on Python 3.9. Use to_dict() for the JSON API.
+    """
+
+    test: str
+    passed: bool
+    elapsed_time: float
+    provider: str
+    details: str = ""
+    error: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for the API, omitting empty details/error"""
+        return {key: value for key, value in self._asdict().items() if value != ""}
+
+
 class ACIDTests:
     """ACID compliance test suite for TPC-C operations with real database testing"""
 
@@ -18,41 +38,16 @@ class ACIDTests:
         self.provider_name = db_connector.get_provider_name()
         self.test_id = int(time.time() * 1000)  # Unique test session ID
         self.test_tables_created = []
+        self._last_counts: Optional[Dict[str, int]] = None
 
     def setup_test_environment(self):
-        """Set up test environment using existing tables for ACID testing"""
-        try:
-            logger.info("🔧 Setting up ACID test environment using existing tables")
-            
-            # Instead of creating new tables, we'll use existing ones for testing
-            # This allows us to test ACID properties on real data without DDL privileges
-            
-            # Check if we have the necessary tables for testing
-            required_tables = ["warehouse", "district", "customer", "order_table", "order_line"]
-            available_tables = []
-            
-            for table_name in required_tables:
-                try:
-                    result = self.db.execute_query(f"SELECT COUNT(*) as count FROM {table_name}")
-                    if result and len(result) > 0:
-                        count = result[0]["count"]
-                        available_tables.append(table_name)
-                        logger.info(f"✅ Table {table_name} available with {count} records")
-                    else:
-                        logger.warning(f"⚠️ Table {table_name} returned no results")
-                except Exception as e:
-                    logger.warning(f"⚠️ Table {table_name} not accessible: {str(e)}")
-            
-            if len(available_tables) < 3:
-                logger.error("❌ Insufficient tables available for ACID testing")
-                return False
-            
-            logger.info(f"✅ ACID test environment ready with {len(available_tables)} tables")
-            return True
+        """Set up test environment using existing tables for ACID testing
 
-        except Exception as e:
-            logger.error(f"❌ Failed to setup test environment: {str(e)}")
-            return False
+        Nothing is pre-flighted: a missing table surfaces as a failed
+        atomicity counts query instead of a separate probe round-trip.
+        """
+        logger.info("🔧 Using existing tables for ACID testing")
+        return True
 
     def cleanup_test_environment(self):
         """Clean up test environment (no tables to drop when using existing tables)"""
@@ -66,10 +61,10 @@ class ACIDTests:
         except Exception as e:
             logger.error(f"❌ Failed to cleanup test environment: {str(e)}")
 
-    def test_atomicity(self) -> Dict[str, Any]:
+    def test_atomicity(self) -> ACIDResult:
         """Test transaction atomicity using existing tables with read-only operations"""
         logger.info("🧪 Testing Atomicity (All-or-Nothing) with existing tables")
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
             # Setup test environment
@@ -83,17 +78,32 @@ class ACIDTests:
                 # Initialize atomicity_passed
                 atomicity_passed = False
                 
-                # Read from multiple tables to test consistency
-                warehouse_data = self.db.execute_query("SELECT COUNT(*) as count FROM warehouse")
-                customer_data = self.db.execute_query("SELECT COUNT(*) as count FROM customer")
-                order_data = self.db.execute_query("SELECT COUNT(*) as count FROM order_table")
+                # Read from multiple tables in a single round-trip
+                counts = self.db.execute_query(
+                    "SELECT (SELECT COUNT(*) FROM warehouse) AS w_cnt, "
+                    "(SELECT COUNT(*) FROM customer) AS c_cnt, "
+                    "(SELECT COUNT(*) FROM order_table) AS o_cnt"
+                )
+                row = counts[0] if counts else {}
+                warehouse_count = row.get("w_cnt")
+                customer_count = row.get("c_cnt")
+                order_count = row.get("o_cnt")
+                
+                logger.info(
+                    "Atomicity: warehouse count: %s, customer count: %s, order count: %s",
+                    *("N/A" if c is None else c for c in (warehouse_count, customer_count, order_count)),
+                )
                 
-                logger.info(f"Warehouse count: {warehouse_data[0]['count'] if warehouse_data else 'N/A'}")
-                logger.info(f"Customer count: {customer_data[0]['count'] if customer_data else 'N/A'}")
-                logger.info(f"Order count: {order_data[0]['count'] if order_data else 'N/A'}")
+                # Durability reuses these counts instead of reading them again
+                if None not in (warehouse_count, customer_count, order_count):
+                    self._last_counts = {
+                        "warehouse": warehouse_count,
+                        "customer": customer_count,
+                        "order_table": order_count,
+                    }
                 
                 # Test that all reads are consistent
-                if warehouse_data and customer_data and order_data:
+                if None not in (warehouse_count, customer_count, order_count):
                     atomicity_passed = True
                     logger.info("✅ Atomicity test passed - consistent reads across tables")
                 else:
@@ -101,36 +111,36 @@ class ACIDTests:
                     logger.error("❌ Atomicity test failed - inconsistent reads")
                 
             except Exception as transaction_error:
-                logger.error(f"Transaction error: {str(transaction_error)}")
+                logger.error(f"Atomicity transaction error: {str(transaction_error)}")
                 atomicity_passed = False
 
             # Cleanup
             self.cleanup_test_environment()
 
-            elapsed_time = time.time() - start_time
-            return {
-                "test": "Atomicity",
-                "passed": atomicity_passed,
-                "elapsed_time": round(elapsed_time, 3),
-                "provider": self.provider_name,
-                "details": "Tested consistent reads across multiple tables"
-            }
+            elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
+            return ACIDResult(
+                test="Atomicity",
+                passed=atomicity_passed,
+                elapsed_time=round(elapsed_time, 3),
+                provider=self.provider_name,
+                details="Tested consistent reads across multiple tables",
+            )
 
         except Exception as e:
             logger.error(f"❌ Atomicity test failed: {str(e)}")
             self.cleanup_test_environment()
-            return {
-                "test": "Atomicity",
-                "passed": False,
-                "elapsed_time": round(time.time() - start_time, 3),
-                "provider": self.provider_name,
-                "error": str(e)
-            }
-
-    def test_consistency(self) -> Dict[str, Any]:
+            return ACIDResult(
+                test="Atomicity",
+                passed=False,
+                elapsed_time=round((time.perf_counter_ns() - start_ns) / 1e9, 3),
+                provider=self.provider_name,
+                error=str(e),
+            )
+
+    def test_consistency(self) -> ACIDResult:
         """Test data consistency using existing tables"""
         logger.info("🧪 Testing Consistency with existing tables")
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
             # Test consistency by checking referential integrity
@@ -141,23 +151,20 @@ class ACIDTests:
                 consistency_passed = False
                 
                 # Check that warehouse IDs in district table exist in warehouse table
-                district_warehouses = self.db.execute_query("SELECT DISTINCT d_w_id FROM district")
-                if district_warehouses:
-                    warehouse_ids = [row["d_w_id"] for row in district_warehouses]
-                    logger.info(f"Found {len(warehouse_ids)} unique warehouse IDs in district table")
-                    
-                    # Check if all district warehouse IDs exist in warehouse table
-                    # Test first 5 to avoid too many queries
-                    test_count = min(5, len(warehouse_ids))
-                    passed_checks = 0
-                    
-                    for w_id in warehouse_ids[:test_count]:
-                        warehouse_check = self.db.execute_query(f"SELECT w_id FROM warehouse WHERE w_id = {w_id}")
-                        if warehouse_check:
-                            passed_checks += 1
-                            logger.info(f"✅ Warehouse {w_id} exists in warehouse table")
-                        else:
-                            logger.error(f"❌ Warehouse {w_id} not found in warehouse table")
+                # with one anti-join instead of a lookup per warehouse ID
+                integrity = self.db.execute_query(
+                    "SELECT COUNT(*) AS total, "
+                    "COUNT(CASE WHEN w.w_id IS NULL THEN 1 END) AS missing "
+                    "FROM (SELECT DISTINCT d_w_id FROM district) d "
+                    "LEFT JOIN warehouse w ON w.w_id = d.d_w_id"
+                )
+                test_count = integrity[0]["total"] if integrity else 0
+                if test_count:
+                    missing = integrity[0]["missing"] or 0
+                    passed_checks = test_count - missing
+                    logger.info(f"Consistency: found {test_count} unique warehouse IDs in district table")
+                    if missing:
+                        logger.error(f"❌ Consistency: {missing} district warehouse IDs not found in warehouse table")
                     
                     # Test passes if at least 80% of checks pass
                     if passed_checks >= test_count * 0.8:
@@ -175,49 +182,53 @@ class ACIDTests:
             # Cleanup
             self.cleanup_test_environment()
 
-            elapsed_time = time.time() - start_time
-            return {
-                "test": "Consistency",
-                "passed": consistency_passed,
-                "elapsed_time": round(elapsed_time, 3),
-                "provider": self.provider_name,
-                "details": f"Tested referential integrity across tables - {passed_checks if 'passed_checks' in locals() else 0} warehouse checks passed"
-            }
+            elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
+            return ACIDResult(
+                test="Consistency",
+                passed=consistency_passed,
+                elapsed_time=round(elapsed_time, 3),
+                provider=self.provider_name,
+                details=f"Tested referential integrity across tables - {passed_checks if 'passed_checks' in locals() else 0} warehouse checks passed",
+            )
 
         except Exception as e:
             logger.error(f"❌ Consistency test failed: {str(e)}")
             self.cleanup_test_environment()
-            return {
-                "test": "Consistency",
-                "passed": False,
-                "elapsed_time": round(time.time() - start_time, 3),
-                "provider": self.provider_name,
-                "error": str(e)
-            }
-
-    def test_isolation(self) -> Dict[str, Any]:
+            return ACIDResult(
+                test="Consistency",
+                passed=False,
+                elapsed_time=round((time.perf_counter_ns() - start_ns) / 1e9, 3),
+                provider=self.provider_name,
+                error=str(e),
+            )
+
+    def test_isolation(self) -> ACIDResult:
         """Test transaction isolation using existing tables"""
         logger.info("🧪 Testing Isolation with existing tables")
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
-            # Test isolation by reading data multiple times to ensure consistency
-            # This tests that concurrent reads don't interfere with each other
+            # Spanner runs one statement against one snapshot, so this only
+            # checks read consistency within a statement. It does not run a
+            # concurrent write, so isolation between transactions is untested
             
             try:
                 # Initialize isolation_passed
                 isolation_passed = False
                 
-                # Read the same data multiple times to test isolation
-                read1 = self.db.execute_query("SELECT COUNT(*) as count FROM customer")
-                read2 = self.db.execute_query("SELECT COUNT(*) as count FROM customer")
-                read3 = self.db.execute_query("SELECT COUNT(*) as count FROM customer")
-                
-                counts = [r[0]["count"] for r in [read1, read2, read3] if r]
+                # Read the same data three times within one statement, so all
+                # reads share a single snapshot
+                reads = self.db.execute_query(
+                    "SELECT COUNT(*) AS c1, "
+                    "(SELECT COUNT(*) FROM customer) AS c2, "
+                    "(SELECT COUNT(*) FROM customer) AS c3 "
+                    "FROM customer"
+                )
+                counts = [reads[0][c] for c in ("c1", "c2", "c3")] if reads else []
                 
                 if len(counts) == 3 and len(set(counts)) == 1:
                     isolation_passed = True
-                    logger.info(f"✅ Isolation test passed - consistent reads: {counts[0]}")
+                    logger.info(f"✅ Isolation test passed - consistent snapshot reads: {counts[0]}")
                 else:
                     isolation_passed = False
                     logger.error(f"❌ Isolation test failed - inconsistent reads: {counts}")
@@ -229,30 +240,30 @@ class ACIDTests:
             # Cleanup
             self.cleanup_test_environment()
 
-            elapsed_time = time.time() - start_time
-            return {
-                "test": "Isolation",
-                "passed": isolation_passed,
-                "elapsed_time": round(elapsed_time, 3),
-                "provider": self.provider_name,
-                "details": "Tested consistent reads under concurrent access"
-            }
+            elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
+            return ACIDResult(
+                test="Isolation",
+                passed=isolation_passed,
+                elapsed_time=round(elapsed_time, 3),
+                provider=self.provider_name,
+                details="Tested consistent reads within one snapshot; concurrent transaction isolation is not exercised",
+            )
 
         except Exception as e:
             logger.error(f"❌ Isolation test failed: {str(e)}")
             self.cleanup_test_environment()
-            return {
-                "test": "Isolation",
-                "passed": False,
-                "elapsed_time": round(time.time() - start_time, 3),
-                "provider": self.provider_name,
-                "error": str(e)
-            }
-
-    def test_durability(self) -> Dict[str, Any]:
+            return ACIDResult(
+                test="Isolation",
+                passed=False,
+                elapsed_time=round((time.perf_counter_ns() - start_ns) / 1e9, 3),
+                provider=self.provider_name,
+                error=str(e),
+            )
+
+    def test_durability(self) -> ACIDResult:
         """Test data durability using existing tables"""
         logger.info("🧪 Testing Durability with existing tables")
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
             # Test durability by reading data and ensuring it persists
@@ -262,13 +273,18 @@ class ACIDTests:
                 # Initialize durability_passed
                 durability_passed = False
                 
-                # Read data from multiple tables to test durability
-                warehouse_count = self.db.execute_query("SELECT COUNT(*) as count FROM warehouse")
-                customer_count = self.db.execute_query("SELECT COUNT(*) as count FROM customer")
+                # Reuse the counts atomicity read earlier in this session;
+                # only query when durability runs on its own
+                if self._last_counts is not None:
+                    data_present = self._last_counts["warehouse"] > 0 and self._last_counts["customer"] > 0
+                else:
+                    data_present = self.db.execute_scalar(
+                        "SELECT EXISTS(SELECT 1 FROM warehouse) AND EXISTS(SELECT 1 FROM customer) AS present"
+                    )
                 
-                if warehouse_count and customer_count:
+                if data_present:
                     durability_passed = True
-                    logger.info(f"✅ Durability test passed - data persists: warehouse={warehouse_count[0]['count']}, customer={customer_count[0]['count']}")
+                    logger.info("✅ Durability test passed - data persists in warehouse and customer")
                 else:
                     durability_passed = False
                     logger.error("❌ Durability test failed - data not accessible")
@@ -280,32 +296,32 @@ class ACIDTests:
             # Cleanup
             self.cleanup_test_environment()
 
-            elapsed_time = time.time() - start_time
-            return {
-                "test": "Durability",
-                "passed": durability_passed,
-                "elapsed_time": round(elapsed_time, 3),
-                "provider": self.provider_name,
-                "details": "Tested data persistence across operations"
-            }
+            elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
+            return ACIDResult(
+                test="Durability",
+                passed=durability_passed,
+                elapsed_time=round(elapsed_time, 3),
+                provider=self.provider_name,
+                details="Tested data persistence across operations",
+            )
 
         except Exception as e:
             logger.error(f"❌ Durability test failed: {str(e)}")
             self.cleanup_test_environment()
-            return {
-                "test": "Durability",
-                "passed": False,
-                "elapsed_time": round(time.time() - start_time, 3),
-                "provider": self.provider_name,
-                "error": str(e)
-            }
+            return ACIDResult(
+                test="Durability",
+                passed=False,
+                elapsed_time=round((time.perf_counter_ns() - start_ns) / 1e9, 3),
+                provider=self.provider_name,
+                error=str(e),
+            )
 
     def run_all_tests(self) -> Dict[str, Any]:
         """Run all ACID compliance tests with real database operations"""
         logger.info(
             f"🧪 Running complete ACID test suite for {self.provider_name} with real database operations"
         )
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         results = {
             "provider": self.provider_name,
@@ -315,27 +331,37 @@ class ACIDTests:
             "tests": {},
         }
 
-        # Run each test independently
-        logger.info("🔄 Running Atomicity Test...")
-        results["tests"]["atomicity"] = self.test_atomicity()
-
-        logger.info("🔄 Running Consistency Test...")
-        results["tests"]["consistency"] = self.test_consistency()
-
-        logger.info("🔄 Running Isolation Test...")
-        results["tests"]["isolation"] = self.test_isolation()
-
-        logger.info("🔄 Running Durability Test...")
-        results["tests"]["durability"] = self.test_durability()
+        # The tests are read-only and independent, so run them concurrently
+        # on the connector's session pool. Durability reuses the counts read
+        # by atomicity, so it runs once atomicity has finished
+        tests = {
+            "atomicity": self.test_atomicity,
+            "consistency": self.test_consistency,
+            "isolation": self.test_isolation,
+        }
+        with ThreadPoolExecutor(
+            max_workers=len(tests), thread_name_prefix="acid"
+        ) as executor:
+            futures = {}
+            for name, test in tests.items():
+                logger.info(f"🔄 Running {name.capitalize()} Test...")
+                futures[name] = executor.submit(test)
+            atomicity = futures["atomicity"].result()
+            logger.info("🔄 Running Durability Test...")
+            durability = self.test_durability()
+            test_results = {
+                "atomicity": atomicity,
+                "consistency": futures["consistency"].result(),
+                "isolation": futures["isolation"].result(),
+                "durability": durability,
+            }
+        results["tests"] = {name: result.to_dict() for name, result in test_results.items()}
 
         # Calculate overall results
-        passed_tests = sum(
-            1 for test in results["tests"].values() if test.get("passed", False)
-        )
-        total_tests = len(results["tests"])
+        passed_tests = sum(1 for result in test_results.values() if result.passed)
+        total_tests = len(test_results)
 
-        end_time = time.time()
-        duration_ms = round((end_time - start_time) * 1000)
+        duration_ms = round((time.perf_counter_ns() - start_ns) / 1e6)
 
         results["summary"] = {
             "total_tests": total_tests,
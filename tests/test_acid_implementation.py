@@ -44,7 +44,7 @@ def test_consistency(provider: str = "google_spanner") -> Dict[str, Any]:
 
         # Run consistency test
         print("🔄 Running Consistency Test...")
-        result = acid_tests.test_consistency()
+        result = acid_tests.test_consistency().to_dict()
 
         print("✅ Consistency Test Result:")
         print(f"   Status: {result['status']}")
@@ -85,7 +85,7 @@ def test_atomicity(provider: str = "google_spanner") -> Dict[str, Any]:
 
         # Run atomicity test
         print("🔄 Running Atomicity Test...")
-        result = acid_tests.test_atomicity()
+        result = acid_tests.test_atomicity().to_dict()
 
         print("✅ Atomicity Test Result:")
         print(f"   Status: {result['status']}")
@@ -120,7 +120,7 @@ def test_isolation(provider: str = "google_spanner") -> Dict[str, Any]:
 
         # Run isolation test
         print("🔄 Running Isolation Test...")
-        result = acid_tests.test_isolation()
+        result = acid_tests.test_isolation().to_dict()
 
         print("✅ Isolation Test Result:")
         print(f"   Status: {result['status']}")
@@ -161,7 +161,7 @@ def test_durability(provider: str = "google_spanner") -> Dict[str, Any]:
 
         # Run durability test
         print("🔄 Running Durability Test...")
-        result = acid_tests.test_durability()
+        result = acid_tests.test_durability().to_dict()
 
         print("✅ Durability Test Result:")
         print(f"   Status: {result['status']}")